@@ -26,8 +26,12 @@ async def main():
 
         w3 = Web3(Web3.HTTPProvider("https://sepolia.base.org"))
 
-        w3.eth.wait_for_transaction_receipt(usdcFaucetHash)
-        w3.eth.wait_for_transaction_receipt(ethFaucetHash)
+        # The web3 provider is synchronous, so receipt waits run in worker threads; this
+        # keeps the event loop free and lets both faucet receipts be awaited together
+        await asyncio.gather(
+            asyncio.to_thread(w3.eth.wait_for_transaction_receipt, usdcFaucetHash),
+            asyncio.to_thread(w3.eth.wait_for_transaction_receipt, ethFaucetHash),
+        )
 
         print(
             f"Received USDC from faucet. Explorer link: https://sepolia.basescan.org/tx/{usdcFaucetHash}"
@@ -44,7 +48,7 @@ async def main():
             network="base-sepolia",
         )
 
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+        receipt = await asyncio.to_thread(w3.eth.wait_for_transaction_receipt, tx_hash)
 
         print(f"Transfer status: {receipt.status}")
         print(f"Explorer link: https://sepolia.basescan.org/tx/{tx_hash}")
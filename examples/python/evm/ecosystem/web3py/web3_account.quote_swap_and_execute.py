@@ -16,21 +16,108 @@ Never share or commit your private key!
 
 import asyncio
 import os
+import time
 from decimal import Decimal
 
+import aiohttp
 from cdp import CdpClient
 from dotenv import load_dotenv
 from eth_account.messages import encode_structured_data
-from web3 import Web3
+from web3 import AsyncWeb3, Web3
+from web3.exceptions import TransactionNotFound
 
 load_dotenv()
 
+# Async Web3 instance for Base mainnet, created on first use so RPC calls do not block the event loop
+_w3_rpc: AsyncWeb3 | None = None
+
+# Token unit scales, built once instead of on every conversion
+USDC_SCALE = Decimal(10) ** 6
+WETH_SCALE = Decimal(10) ** 18
+
+# Base mainnet chain id, set on the transaction so signing never has to ask the RPC for it
+BASE_CHAIN_ID = 8453
+
+# Receipt polling starts quickly and backs off to roughly the Base block time (~2s)
+RECEIPT_POLL_START_SECONDS = 0.25
+RECEIPT_POLL_MAX_SECONDS = 2.0
+RECEIPT_TIMEOUT_SECONDS = 120
+
+
+async def get_w3() -> AsyncWeb3:
+    """Return the shared AsyncWeb3 instance, creating it on first use.
+    
+    The provider is given one keep-alive session, so every RPC call reuses open connections.
+    """
+    global _w3_rpc
+    if _w3_rpc is None:
+        w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider('https://mainnet.base.org', request_kwargs={'timeout': 30}))
+        await w3.provider.cache_async_session(
+            aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        )
+        _w3_rpc = w3
+    return _w3_rpc
+
+
+async def close_w3():
+    """Close the AsyncWeb3 provider's HTTP session, if it was created."""
+    global _w3_rpc
+    if _w3_rpc is not None:
+        await _w3_rpc.provider.disconnect()
+        _w3_rpc = None
+
+
+async def wait_for_receipt(w3: AsyncWeb3, tx_hash):
+    """Poll for a transaction receipt, backing off from 250ms up to the Base block time.
+    
+    Args:
+        w3: The AsyncWeb3 instance to poll with
+        tx_hash: The hash of the submitted transaction
+        
+    Returns:
+        The transaction receipt
+        
+    Raises:
+        TimeoutError: If the transaction is not mined within RECEIPT_TIMEOUT_SECONDS
+    """
+    deadline = time.monotonic() + RECEIPT_TIMEOUT_SECONDS
+    delay = RECEIPT_POLL_START_SECONDS
+    while True:
+        try:
+            return await w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            pass
+        if time.monotonic() + delay > deadline:
+            raise TimeoutError(f"Transaction {tx_hash.hex()} not mined after {RECEIPT_TIMEOUT_SECONDS}s")
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.5, RECEIPT_POLL_MAX_SECONDS)
+
+
+async def fetch_account_state(w3: AsyncWeb3, address: str) -> tuple[int, int, int]:
+    """Read an account's ETH balance, nonce and the current gas price in one JSON-RPC batch.
+    
+    Args:
+        w3: The AsyncWeb3 instance to read with
+        address: The account address
+        
+    Returns:
+        tuple: (balance in wei, transaction count, gas price in wei)
+    """
+    async with w3.batch_requests() as batch:
+        batch.add(w3.eth.get_balance(address))
+        batch.add(w3.eth.get_transaction_count(address))
+        batch.add(w3.eth.gas_price)
+        balance, nonce, gas_price = await batch.async_execute()
+    return balance, nonce, gas_price
+
 
 async def main():
     """Create a swap quote and execute it using web3.py."""
     async with CdpClient() as cdp:
         # Connect to Base mainnet
-        w3 = Web3(Web3.HTTPProvider('https://mainnet.base.org'))
+        w3 = await get_w3()
         
         # IMPORTANT: In production, use environment variables or secure key management
         # Example: private_key = os.getenv("PRIVATE_KEY")
@@ -53,20 +140,21 @@ async def main():
         print(f"Wallet address: {wallet_address}")
         print(f"Swap: 10 USDC → WETH on Base")
         
-        # Check wallet balance
-        balance = w3.eth.get_balance(wallet_address)
-        print(f"ETH balance: {w3.from_wei(balance, 'ether')} ETH\n")
-        
         try:
-            # Create a swap quote
-            quote = await cdp.evm.create_swap_quote(
-                from_token=USDC,
-                to_token=WETH,
-                from_amount="10000000",  # 10 USDC (6 decimals)
-                network="base",
-                taker=wallet_address,
-                slippage_bps=100,  # 1% slippage
+            # Read the wallet balance, nonce and gas price in one RPC batch while the swap
+            # quote is created; the two requests are independent, so they run concurrently
+            (balance, nonce, gas_price), quote = await asyncio.gather(
+                fetch_account_state(w3, wallet_address),
+                cdp.evm.create_swap_quote(
+                    from_token=USDC,
+                    to_token=WETH,
+                    from_amount="10000000",  # 10 USDC (6 decimals)
+                    network="base",
+                    taker=wallet_address,
+                    slippage_bps=100,  # 1% slippage
+                ),
             )
+            print(f"ETH balance: {w3.from_wei(balance, 'ether')} ETH\n")
             
             # Check if liquidity is available
             if not quote.liquidity_available:
@@ -77,9 +165,9 @@ async def main():
             # Display quote details
             print("📊 Swap Quote Details:")
             print(f"   Quote ID: {quote.quote_id}")
-            print(f"   Selling: {Decimal(quote.from_amount) / Decimal(10**6):.2f} USDC")
-            print(f"   Expected output: {Decimal(quote.to_amount) / Decimal(10**18):.6f} WETH")
-            print(f"   Minimum output: {Decimal(quote.min_to_amount) / Decimal(10**18):.6f} WETH")
+            print(f"   Selling: {Decimal(quote.from_amount) / USDC_SCALE:.2f} USDC")
+            print(f"   Expected output: {Decimal(quote.to_amount) / WETH_SCALE:.6f} WETH")
+            print(f"   Minimum output: {Decimal(quote.min_to_amount) / WETH_SCALE:.6f} WETH")
             
             # Prepare transaction
             print("\n📋 Preparing transaction...")
@@ -87,11 +175,12 @@ async def main():
             # Build the transaction
             transaction = {
                 'from': wallet_address,
+                'chainId': BASE_CHAIN_ID,
                 'to': Web3.to_checksum_address(quote.to),
                 'data': quote.data,
                 'value': int(quote.value),
                 'gas': quote.gas_limit if quote.gas_limit else 200000,
-                'nonce': w3.eth.get_transaction_count(wallet_address),
+                'nonce': nonce,
             }
             
             # Add gas price parameters
@@ -100,8 +189,8 @@ async def main():
                 transaction['maxFeePerGas'] = int(quote.max_fee_per_gas)
                 transaction['maxPriorityFeePerGas'] = int(quote.max_priority_fee_per_gas)
             else:
-                # Legacy transaction - get current gas price
-                transaction['gasPrice'] = w3.eth.gas_price
+                # Legacy transaction - use the gas price read with the balance
+                transaction['gasPrice'] = gas_price
             
             # Handle Permit2 signature if required
             if quote.requires_signature and quote.permit2_data:
@@ -139,7 +228,7 @@ async def main():
             # Estimate gas if not provided
             if not quote.gas_limit:
                 print("\n⛽ Estimating gas...")
-                gas_estimate = w3.eth.estimate_gas(transaction)
+                gas_estimate = await w3.eth.estimate_gas(transaction)
                 transaction['gas'] = int(gas_estimate * 1.2)  # Add 20% buffer
                 print(f"   Estimated gas: {gas_estimate}, using: {transaction['gas']}")
             
@@ -149,13 +238,13 @@ async def main():
             
             # Send the transaction
             print("\n📤 Sending transaction...")
-            tx_hash = w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+            tx_hash = await w3.eth.send_raw_transaction(signed_txn.rawTransaction)
             print(f"   Transaction hash: {tx_hash.hex()}")
             print(f"   Explorer: https://basescan.org/tx/{tx_hash.hex()}")
             
             # Wait for confirmation
             print("\n⏳ Waiting for confirmation...")
-            receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await wait_for_receipt(w3, tx_hash)
             
             if receipt['status'] == 1:
                 print("\n✅ Swap successful!")
@@ -169,5 +258,13 @@ async def main():
             print(f"\n❌ Error: {e}")
 
 
+async def run():
+    """Run the example and close the web3 provider's session afterwards."""
+    try:
+        await main()
+    finally:
+        await close_w3()
+
+
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    asyncio.run(run()) 
\ No newline at end of file
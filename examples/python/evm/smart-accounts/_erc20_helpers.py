@@ -0,0 +1,288 @@
+"""ERC20 allowance helpers for the smart account swap examples.
+
+Only swaps that send an ERC20 token need these, so _swap_common imports this module
+on first use; native-asset swaps never load it or build its JSON-RPC client.
+"""
+
+import functools
+import itertools
+import json
+import os
+
+import aiohttp
+from cdp import EncodedCall
+from eth_abi import decode, encode
+from web3 import Web3
+
+from _swap_common import NETWORK
+
+# Permit2 contract address is the same across all networks
+PERMIT2_ADDRESS = "0x000000000022D473030F116dDEE9F6B43aC78BA3"
+
+# Base mainnet RPC endpoint used for read-only contract calls
+RPC_URL = "https://mainnet.base.org"
+
+# Connection pool settings for the RPC client (override via environment variables)
+RPC_POOL_PER_HOST = int(os.getenv("CDP_RPC_POOL_PER_HOST", "16"))
+RPC_KEEPALIVE_TIMEOUT_SECONDS = 75
+RPC_REQUEST_TIMEOUT_SECONDS = float(os.getenv("CDP_RPC_REQUEST_TIMEOUT", "10"))
+
+# Compact JSON encoder for RPC request bodies (no whitespace between tokens)
+RPC_JSON_DUMPS = functools.partial(json.dumps, separators=(",", ":"))
+
+# Multicall3 contract address is the same across all networks
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Maximum number of calls aggregated into a single Multicall3 eth_call (keeps gas in check)
+MAX_MULTICALL_SIZE = 500
+
+# Function selectors
+ALLOWANCE_SELECTOR = bytes.fromhex("dd62ed3e")  # allowance(address,address)
+APPROVE_SELECTOR = bytes.fromhex("095ea7b3")  # approve(address,uint256)
+BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")  # balanceOf(address)
+AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")  # aggregate3((address,bool,bytes)[])
+
+
+class RPCClient:
+    """Minimal async JSON-RPC client for read-only eth_call requests.
+
+    Requests are sent with aiohttp so the event loop keeps running while they are
+    in flight. One pooled keep-alive session is reused for the lifetime of the
+    example, so every call after the first skips the TCP and TLS handshake.
+    """
+
+    def __init__(self, rpc_url: str):
+        self.rpc_url = rpc_url
+        self._session: aiohttp.ClientSession | None = None
+        self._ids = itertools.count(1)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the pooled HTTP session on first use, inside the running event loop."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=RPC_POOL_PER_HOST,
+                    keepalive_timeout=RPC_KEEPALIVE_TIMEOUT_SECONDS,
+                ),
+                timeout=aiohttp.ClientTimeout(total=RPC_REQUEST_TIMEOUT_SECONDS),
+                json_serialize=RPC_JSON_DUMPS,
+            )
+        return self._session
+
+    def _eth_call_request(self, to: str, data: str) -> dict:
+        """Build a JSON-RPC eth_call request against the latest block."""
+        return {
+            "jsonrpc": "2.0",
+            "id": next(self._ids),
+            "method": "eth_call",
+            "params": [{"to": to, "data": data}, "latest"],
+        }
+
+    async def eth_call(self, to: str, data: str) -> str:
+        """Execute a single eth_call against the latest block.
+
+        Args:
+            to: The contract address to call
+            data: The hex-encoded calldata
+
+        Returns:
+            The hex-encoded return data
+        """
+        async with self._get_session().post(
+            self.rpc_url, json=self._eth_call_request(to, data)
+        ) as response:
+            response.raise_for_status()
+            item = json.loads(await response.read())
+
+        if "error" in item:
+            raise RuntimeError(f"eth_call failed: {item['error'].get('message')}")
+        return item["result"]
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+# Shared JSON-RPC client for allowance reads
+rpc = RPCClient(RPC_URL)
+
+
+async def handle_token_allowance(
+    smart_account,
+    token_address: str,
+    token_symbol: str,
+    from_amount: int
+) -> None:
+    """
+    Handles token allowance check and approval if needed for smart accounts.
+    
+    Args:
+        smart_account: The smart account instance
+        token_address: The address of the token to be sent
+        token_symbol: The symbol of the token (e.g., WETH, USDC)
+        from_amount: The amount to be sent
+    """
+    print("\n🔐 Checking token allowance for smart account...")
+    
+    # Check allowance (and balance) before attempting the swap
+    current_allowance, current_balance = await get_token_state(
+        smart_account.address,
+        token_address,
+        token_symbol
+    )
+    
+    if current_balance < from_amount:
+        print(f"⚠️ Balance may be insufficient. Current: {Web3.from_wei(current_balance, 'ether')} {token_symbol}")
+    
+    # If allowance is insufficient, approve tokens
+    if current_allowance < from_amount:
+        from_amount_eth = Web3.from_wei(from_amount, 'ether')
+        current_allowance_eth = Web3.from_wei(current_allowance, 'ether')
+        print(f"❌ Allowance insufficient. Current: {current_allowance_eth}, Required: {from_amount_eth}")
+        
+        # Set the allowance to the required amount via user operation
+        await approve_token_allowance(
+            smart_account,
+            token_address,
+            PERMIT2_ADDRESS,
+            from_amount
+        )
+        print(f"✅ Set allowance to {from_amount_eth} {token_symbol}")
+    else:
+        current_allowance_eth = Web3.from_wei(current_allowance, 'ether')
+        print(f"✅ Token allowance sufficient. Current: {current_allowance_eth} {token_symbol}")
+
+
+async def approve_token_allowance(
+    smart_account,
+    token_address: str,
+    spender_address: str,
+    amount: int
+) -> None:
+    """
+    Handle approval for token allowance if needed for smart accounts.
+    This is necessary when swapping ERC20 tokens (not native ETH).
+    The Permit2 contract needs approval to move tokens on behalf of the smart account.
+    
+    Args:
+        smart_account: The smart account instance
+        token_address: The token contract address
+        spender_address: The address allowed to spend the tokens
+        amount: The amount to approve
+    """
+    print(f"\nApproving token allowance for {token_address} to spender {spender_address}")
+    
+    # Encode the approve function call locally (no RPC round-trip needed)
+    data = encode_approve_call(spender_address, amount)
+    
+    # Send the approve transaction via user operation
+    user_op_result = await smart_account.send_user_operation(
+        network=NETWORK,
+        calls=[
+            EncodedCall(
+                to=token_address,
+                data=data,
+                value=0,
+            )
+        ],
+    )
+    
+    print(f"Approval user operation hash: {user_op_result.user_op_hash}")
+    
+    # Wait for approval user operation to be confirmed
+    receipt = await smart_account.wait_for_user_operation(
+        user_op_hash=user_op_result.user_op_hash,
+    )
+    
+    print(f"Approval confirmed with status: {receipt.status} ✅")
+
+
+def address_word(address: str) -> bytes:
+    """ABI-encode an address as a left-padded 32-byte word."""
+    return bytes.fromhex(address[2:].zfill(64))
+
+
+def uint_word(value: int) -> bytes:
+    """ABI-encode an unsigned integer as a 32-byte big-endian word."""
+    return value.to_bytes(32, "big")
+
+
+@functools.lru_cache(maxsize=64)
+def encode_allowance_call(owner: str) -> str:
+    """Encode allowance(owner, Permit2) calldata, memoized per owner.
+
+    Every argument is a static word, so the calldata is assembled by hand rather than
+    going through eth_abi's type parser.
+    """
+    args = address_word(owner) + address_word(PERMIT2_ADDRESS)
+    return "0x" + (ALLOWANCE_SELECTOR + args).hex()
+
+
+def encode_approve_call(spender: str, amount: int) -> str:
+    """Encode approve(spender, amount) calldata from the precomputed selector."""
+    args = address_word(spender) + uint_word(amount)
+    return "0x" + (APPROVE_SELECTOR + args).hex()
+
+
+async def multicall(calls: list[tuple[str, bytes]]) -> list[bytes | None]:
+    """
+    Execute read-only calls in a single eth_call through Multicall3's aggregate3.
+    
+    Each call is sent with allowFailure=True, so one reverting call does not
+    abort the others.
+    
+    Args:
+        calls: The (target, calldata) pairs to execute
+        
+    Returns:
+        The return data of each call, or None if that call failed
+    """
+    results = []
+    for start in range(0, len(calls), MAX_MULTICALL_SIZE):
+        call3s = [(target, True, calldata) for target, calldata in calls[start:start + MAX_MULTICALL_SIZE]]
+        data = AGGREGATE3_SELECTOR + encode(["(address,bool,bytes)[]"], [call3s])
+        
+        result = await rpc.eth_call(MULTICALL3_ADDRESS, "0x" + data.hex())
+        (call_results,) = decode(["(bool,bytes)[]"], bytes.fromhex(result[2:]))
+        results.extend(return_data if success else None for success, return_data in call_results)
+    
+    return results
+
+
+async def get_token_state(
+    owner: str,
+    token: str,
+    symbol: str
+) -> tuple[int, int]:
+    """
+    Check token allowance for the Permit2 contract along with the owner's token balance
+    in one RPC round-trip.
+    
+    Args:
+        owner: The token owner's address (smart account)
+        token: The token contract address
+        symbol: The token symbol for logging
+        
+    Returns:
+        The current allowance and token balance
+    """
+    print(f"\nChecking allowance for {symbol} ({token}) to Permit2 contract...")
+    
+    try:
+        owner_args = address_word(owner)
+        allowance_data, balance_data = await multicall([
+            (token, bytes.fromhex(encode_allowance_call(owner)[2:])),
+            (token, BALANCE_OF_SELECTOR + owner_args),
+        ])
+        
+        allowance = int.from_bytes(allowance_data, "big") if allowance_data else 0
+        balance = int.from_bytes(balance_data, "big") if balance_data else 0
+        
+        print(f"Current allowance: {Web3.from_wei(allowance, 'ether')} {symbol}")
+        print(f"Current balance: {Web3.from_wei(balance, 'ether')} {symbol}")
+        return allowance, balance
+    except Exception as error:
+        print(f"Error checking allowance: {error}")
+        return 0, 0
@@ -21,12 +21,11 @@ async def main():
         w3 = Web3(Web3.HTTPProvider("https://sepolia.base.org"))
         w3.eth.wait_for_transaction_receipt(transaction_hash)
 
-        balances = await smart_account.list_token_balances(
+        # Balances are printed as each page arrives, following pagination automatically
+        async for balance in smart_account.list_token_balances_stream(
             network="base-sepolia",
             page_size=10,
-        )
-
-        for balance in balances.balances:
+        ):
             print(f"Token contract address: {balance.token.contract_address}")
             print(f"Token balance: {balance.amount.amount}")
 
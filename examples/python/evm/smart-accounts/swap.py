@@ -46,13 +46,26 @@ Choose based on your needs:
 """
 
 import asyncio
+import functools
 from decimal import Decimal
+from typing import TYPE_CHECKING
 
-from cdp import CdpClient, EncodedCall
+from cdp import EncodedCall
 from cdp.actions.evm.swap.types import SmartAccountSwapOptions
 from cdp.utils import parse_units
 from dotenv import load_dotenv
-from web3 import Web3
+
+from _swap_common import (
+    flush_log,
+    get_cdp_client,
+    get_or_create_account,
+    get_or_create_smart_account,
+    log,
+    run_example,
+)
+
+if TYPE_CHECKING:
+    from web3 import AsyncWeb3
 
 load_dotenv()
 
@@ -60,168 +73,209 @@ load_dotenv()
 NETWORK = "base"  # Base mainnet
 
 # Token definitions for the example (using Base mainnet token addresses)
+# "scale" converts smallest units to whole tokens and is computed once at import
 TOKENS = {
     "WETH": {
         "address": "0x4200000000000000000000000000000000000006",
         "symbol": "WETH",
         "decimals": 18,
-        "is_native_asset": False
+        "is_native_asset": False,
+        "scale": Decimal(10) ** 18,
     },
     "USDC": {
         "address": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
         "symbol": "USDC",
         "decimals": 6,
-        "is_native_asset": False
+        "is_native_asset": False,
+        "scale": Decimal(10) ** 6,
     },
 }
 
+# Wei per ether, for formatting gas fees
+WEI = Decimal(10) ** 18
+
 # Permit2 contract address is the same across all networks
 PERMIT2_ADDRESS = "0x000000000022D473030F116dDEE9F6B43aC78BA3"
 
-# Web3 instance for transaction monitoring (Base mainnet RPC)
-w3_rpc = Web3(Web3.HTTPProvider('https://mainnet.base.org'))
-
-# ERC20 ABI for allowance and approve functions
-ERC20_ABI = [
-    {
-        "constant": True,
-        "inputs": [
-            {"name": "owner", "type": "address"},
-            {"name": "spender", "type": "address"}
-        ],
-        "name": "allowance",
-        "outputs": [{"name": "", "type": "uint256"}],
-        "type": "function"
-    },
-    {
-        "constant": False,
-        "inputs": [
-            {"name": "spender", "type": "address"},
-            {"name": "amount", "type": "uint256"}
-        ],
-        "name": "approve",
-        "outputs": [{"name": "", "type": "bool"}],
-        "type": "function"
-    }
-]
+# Multicall3 is deployed at the same address on all major networks, including Base
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Async Web3 instance for allowance and balance checks (Base mainnet RPC), created on first use
+# web3 and eth_abi are imported where they are used, so native-asset swaps never load them
+_w3_rpc: "AsyncWeb3 | None" = None
+
+# Function selectors for approve(address,uint256), allowance(address,address) and balanceOf(address)
+APPROVE_SELECTOR = bytes.fromhex("095ea7b3")
+ALLOWANCE_SELECTOR = bytes.fromhex("dd62ed3e")
+BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")
+
+# Function selector for Multicall3 aggregate3((address,bool,bytes)[])
+AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")
+
+
+async def get_w3() -> "AsyncWeb3":
+    """Return the shared AsyncWeb3 instance, creating it on first use.
+    
+    Swaps from native assets never check allowances or balances, so they never
+    pay for the provider setup. The provider is given one keep-alive session with
+    a larger connection pool, so every RPC call reuses open connections.
+    """
+    global _w3_rpc
+    if _w3_rpc is None:
+        import aiohttp
+        from web3 import AsyncWeb3
+
+        w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider('https://mainnet.base.org', request_kwargs={'timeout': 10}))
+        await w3.provider.cache_async_session(
+            aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        )
+        _w3_rpc = w3
+    return _w3_rpc
+
+
+async def close_w3() -> None:
+    """Close the AsyncWeb3 provider's HTTP session, if it was created."""
+    global _w3_rpc
+    if _w3_rpc is not None:
+        await _w3_rpc.provider.disconnect()
+        _w3_rpc = None
 
 
 async def main():
     """Demonstrate smart account swap functionality."""
-    print(f"Note: This example is using {NETWORK} network with smart accounts. Make sure you have funds available.")
+    log(f"Note: This example is using {NETWORK} network with smart accounts. Make sure you have funds available.")
     
-    async with CdpClient() as cdp:
-        # Create an owner account for the smart account
-        owner_account = await cdp.evm.get_or_create_account(name="SmartAccountOwner")
-        print(f"Owner account: {owner_account.address}")
+    cdp = await get_cdp_client()
 
-        # Create a smart account
-        smart_account = await cdp.evm.get_or_create_smart_account(owner=owner_account, name="SmartAccount")
-        print(f"Smart account: {smart_account.address}")
+    # Create an owner account for the smart account
+    owner_account = await get_or_create_account(cdp, name="SmartAccountOwner")
+    log(f"Owner account: {owner_account.address}")
 
-        try:
-            # Define the tokens we're working with
-            from_token = TOKENS["WETH"]
-            to_token = TOKENS["USDC"]
-            
-            # Set the amount we want to send
-            from_amount = parse_units("0.1", from_token["decimals"])  # 0.1 WETH
-            
-            from_amount_decimal = Decimal(from_amount) / Decimal(10 ** from_token["decimals"])
-            print(f"\nInitiating smart account swap: {from_amount_decimal:.6f} {from_token['symbol']} → {to_token['symbol']}")
+    # Create a smart account
+    smart_account = await get_or_create_smart_account(cdp, owner=owner_account, name="SmartAccount")
+    log(f"Smart account: {smart_account.address}")
+
+    try:
+        # Define the tokens we're working with
+        from_token = TOKENS["WETH"]
+        to_token = TOKENS["USDC"]
+        
+        # Set the amount we want to send
+        from_amount = parse_units("0.1", from_token["decimals"])  # 0.1 WETH
+        
+        from_amount_decimal = Decimal(from_amount) / from_token["scale"]
+        log(f"\nInitiating smart account swap: {from_amount_decimal:.6f} {from_token['symbol']} → {to_token['symbol']}")
 
-            # Handle token allowance check and approval if needed (applicable when sending non-native assets only)
+        # Approach 1: All-in-one pattern (RECOMMENDED)
+        log("\n=== APPROACH 1: All-in-one pattern ===")
+        
+        try:
+            approve_call = None
             if not from_token["is_native_asset"]:
-                await handle_token_allowance(
+                # Non-native assets need a Permit2 allowance before the swap executes. The allowance
+                # and balance come back from a single RPC round-trip, so an account that cannot
+                # cover the swap is turned away before the swap is requested.
+                approve_call = await handle_token_allowance(
                     smart_account,
                     from_token["address"],
                     from_token["symbol"],
                     from_amount
                 )
-            
-            # Approach 1: All-in-one pattern (RECOMMENDED)
-            print("\n=== APPROACH 1: All-in-one pattern ===")
-            
-            try:
-                # Create and execute the swap in one call - simpler but less control
-                result = await smart_account.swap(
-                    SmartAccountSwapOptions(
-                        network=NETWORK,
-                        from_token=from_token["address"],
-                        to_token=to_token["address"],
-                        from_amount=from_amount,
-                        slippage_bps=100,  # 1% slippage tolerance
-                        # Optional: paymaster_url="https://paymaster.example.com"
-                    )
-                )
 
-                """ Alternative - Approach 2: Create swap quote first, inspect it, then send it separately
-                # This gives you more control to analyze the swap details before execution
-                
-                # Step 1: Create the swap quote
-                swap_quote = await smart_account.quote_swap(
+            # Create and execute the swap in one call - simpler but less control. If an approval
+            # is needed it runs first in the same user operation as the swap, so there is only
+            # one user operation to submit and wait for
+            result = await smart_account.swap(
+                SmartAccountSwapOptions(
                     network=NETWORK,
                     from_token=from_token["address"],
                     to_token=to_token["address"],
                     from_amount=from_amount,
                     slippage_bps=100,  # 1% slippage tolerance
-                    # Optional: paymaster_url="https://paymaster.example.com"  # For gas sponsorship
-                )
-                
-                # Step 2: Check if liquidity is available
-                if not swap_quote.liquidity_available:
-                    print("\n❌ Swap failed: Insufficient liquidity for this swap pair or amount.")
-                    return
-                
-                # Step 3: Optionally inspect swap details
-                to_amount_decimal = Decimal(swap_quote.to_amount) / Decimal(10 ** to_token["decimals"])
-                min_to_amount_decimal = Decimal(swap_quote.min_to_amount) / Decimal(10 ** to_token["decimals"])
-                print(f"Receive Amount: {to_amount_decimal:.{to_token['decimals']}f} {to_token['symbol']}")
-                print(f"Min Receive Amount: {min_to_amount_decimal:.{to_token['decimals']}f} {to_token['symbol']}")
-                if hasattr(swap_quote, 'fees') and swap_quote.fees and hasattr(swap_quote.fees, 'gas_fee'):
-                    gas_fee_amount = Decimal(swap_quote.fees.gas_fee.amount) / Decimal(10 ** 18)
-                    print(f"Gas Fee: {gas_fee_amount:.6f} {swap_quote.fees.gas_fee.token}")
-                
-                # Step 4: Execute the swap via user operation
-                # Option A: Using smart_account.swap() with the pre-created swap quote
-                result = await smart_account.swap(
-                    SmartAccountSwapOptions(
-                        swap_quote=swap_quote,
-                    )
+                    pre_swap_calls=[approve_call] if approve_call else None,
+                    # Optional: paymaster_url="https://paymaster.example.com"
                 )
-                
-                # Option B: Using the swap quote's execute() method directly
-                # result = await swap_quote.execute()
-
-                """
-
-                print(f"\n✅ Smart account swap submitted successfully!")
-                print(f"User operation hash: {result.user_op_hash}")
-                print(f"Smart account address: {result.smart_account_address}")
-                print(f"Status: {result.status}")
+            )
 
-                # Wait for user operation completion
-                receipt = await smart_account.wait_for_user_operation(
-                    user_op_hash=result.user_op_hash,
-                    timeout_seconds=60,
+            """ Alternative - Approach 2: Create swap quote first, inspect it, then send it separately
+            # This gives you more control to analyze the swap details before execution
+            
+            # Step 1: Create the swap quote
+            swap_quote = await smart_account.quote_swap(
+                network=NETWORK,
+                from_token=from_token["address"],
+                to_token=to_token["address"],
+                from_amount=from_amount,
+                slippage_bps=100,  # 1% slippage tolerance
+                # Optional: paymaster_url="https://paymaster.example.com"  # For gas sponsorship
+            )
+            
+            # Step 2: Check if liquidity is available
+            if not swap_quote.liquidity_available:
+                print("\n❌ Swap failed: Insufficient liquidity for this swap pair or amount.")
+                return
+            
+            # Step 3: Optionally inspect swap details
+            to_amount_decimal = Decimal(swap_quote.to_amount) / to_token["scale"]
+            min_to_amount_decimal = Decimal(swap_quote.min_to_amount) / to_token["scale"]
+            print(f"Receive Amount: {to_amount_decimal:.{to_token['decimals']}f} {to_token['symbol']}")
+            print(f"Min Receive Amount: {min_to_amount_decimal:.{to_token['decimals']}f} {to_token['symbol']}")
+            gas_fee = getattr(getattr(swap_quote, 'fees', None), 'gas_fee', None)
+            if gas_fee:
+                gas_fee_amount = Decimal(gas_fee.amount) / WEI
+                print(f"Gas Fee: {gas_fee_amount:.6f} {gas_fee.token}")
+            
+            # Step 4: Execute the swap via user operation
+            # Option A: Using smart_account.swap() with the pre-created swap quote
+            result = await smart_account.swap(
+                SmartAccountSwapOptions(
+                    swap_quote=swap_quote,
                 )
+            )
+            
+            # Option B: Using the swap quote's execute() method directly
+            # result = await swap_quote.execute()
+
+            """
+
+            log(f"\n✅ Smart account swap submitted successfully!")
+            log(f"User operation hash: {result.user_op_hash}")
+            log(f"Smart account address: {result.smart_account_address}")
+            log(f"Status: {result.status}")
+            flush_log()
+
+            # Wait for user operation completion
+            # Poll quickly at first and back off, since most user operations land within a few blocks
+            receipt = await smart_account.wait_for_user_operation(
+                user_op_hash=result.user_op_hash,
+                timeout_seconds=60,
+                interval_seconds=0.05,
+                max_interval_seconds=2,
+                backoff_factor=1.5,
+            )
 
-                print("\n🎉 Smart Account Swap User Operation Completed!")
-                print(f"Final status: {receipt.status}")
-                
-                if receipt.status == "complete":
-                    print(f"Transaction Explorer: https://basescan.org/tx/{result.user_op_hash}")
-
-            except Exception as error:
-                # The all-in-one pattern will throw an error if liquidity is not available
-                if "Insufficient liquidity" in str(error):
-                    print("\n❌ Swap failed: Insufficient liquidity for this swap pair or amount.")
-                    print("Try reducing the swap amount or using a different token pair.")
-                else:
-                    raise error
+            log("\n🎉 Smart Account Swap User Operation Completed!")
+            log(f"Final status: {receipt.status}")
+            
+            if receipt.status == "complete":
+                log(f"Transaction Explorer: https://basescan.org/tx/{result.user_op_hash}")
+            flush_log()
 
         except Exception as error:
-            print(f"Error executing smart account swap: {error}")
+            # The all-in-one pattern will throw an error if liquidity is not available
+            if "Insufficient liquidity" in str(error):
+                log("\n❌ Swap failed: Insufficient liquidity for this swap pair or amount.")
+                log("Try reducing the swap amount or using a different token pair.")
+            else:
+                raise error
+
+    except Exception as error:
+        flush_log()
+        print(f"Error executing smart account swap: {error}")
+    finally:
+        await close_w3()
 
 
 async def handle_token_allowance(
@@ -229,124 +283,149 @@ async def handle_token_allowance(
     token_address: str,
     token_symbol: str,
     from_amount: int
-) -> None:
+) -> EncodedCall | None:
     """
-    Handles token allowance check and approval if needed for smart accounts.
+    Handles token allowance and balance checks for smart accounts.
+
+    Rather than sending the approval as its own user operation, this returns the approve
+    call so it can be batched into the swap user operation.
     
     Args:
         smart_account: The smart account instance
         token_address: The address of the token to be sent
         token_symbol: The symbol of the token (e.g., WETH, USDC)
         from_amount: The amount to be sent
+
+    Returns:
+        The approve call to run before the swap, or None if the allowance is sufficient
+
+    Raises:
+        ValueError: If the smart account's token balance is below from_amount
     """
-    print("\n🔐 Checking token allowance for smart account...")
-    
-    # Check allowance before attempting the swap
-    current_allowance = await get_allowance(
-        smart_account.address,
-        token_address,
-        token_symbol
-    )
+    from web3 import Web3
+
+    log("\n🔐 Checking token allowance and balance for smart account...")
+    log(f"\nChecking allowance for {token_symbol} ({token_address}) to Permit2 contract...")
     
-    # If allowance is insufficient, approve tokens
-    if current_allowance < from_amount:
-        from_amount_eth = Web3.from_wei(from_amount, 'ether')
-        current_allowance_eth = Web3.from_wei(current_allowance, 'ether')
-        print(f"❌ Allowance insufficient. Current: {current_allowance_eth}, Required: {from_amount_eth}")
-        
-        # Set the allowance to the required amount via user operation
-        await approve_token_allowance(
-            smart_account,
+    # Fetch the allowance and balance together before attempting the swap
+    try:
+        current_allowance, balance = await multicall_allowance_and_balance(
+            smart_account.address,
             token_address,
-            PERMIT2_ADDRESS,
-            from_amount
+            PERMIT2_ADDRESS
         )
-        print(f"✅ Set allowance to {from_amount_eth} {token_symbol}")
-    else:
+    except Exception as error:
+        # Fall back to batching an approval and let the swap report any balance problem
+        flush_log()
+        print(f"Error checking allowance and balance: {error}")
+        current_allowance, balance = 0, None
+    
+    if balance is not None:
+        log(f"Current allowance: {Web3.from_wei(current_allowance, 'ether')} {token_symbol}")
+        log(f"Current balance: {Web3.from_wei(balance, 'ether')} {token_symbol}")
+        if balance < from_amount:
+            raise ValueError(
+                f"Insufficient {token_symbol} balance. "
+                f"Current: {Web3.from_wei(balance, 'ether')}, Required: {Web3.from_wei(from_amount, 'ether')}"
+            )
+    
+    # If allowance is sufficient, nothing needs to run before the swap
+    if current_allowance >= from_amount:
         current_allowance_eth = Web3.from_wei(current_allowance, 'ether')
-        print(f"✅ Token allowance sufficient. Current: {current_allowance_eth} {token_symbol}")
+        log(f"✅ Token allowance sufficient. Current: {current_allowance_eth} {token_symbol}")
+        return None
+    
+    from_amount_eth = Web3.from_wei(from_amount, 'ether')
+    current_allowance_eth = Web3.from_wei(current_allowance, 'ether')
+    log(f"❌ Allowance insufficient. Current: {current_allowance_eth}, Required: {from_amount_eth}")
+    log(f"Approval of {from_amount_eth} {token_symbol} will be batched with the swap")
+    
+    return build_approve_call(token_address, PERMIT2_ADDRESS, from_amount)
 
 
-async def approve_token_allowance(
-    smart_account,
+def build_approve_call(
     token_address: str,
     spender_address: str,
     amount: int
-) -> None:
+) -> EncodedCall:
     """
-    Handle approval for token allowance if needed for smart accounts.
+    Build the approve call for token allowance for smart accounts.
     This is necessary when swapping ERC20 tokens (not native ETH).
     The Permit2 contract needs approval to move tokens on behalf of the smart account.
     
     Args:
-        smart_account: The smart account instance
         token_address: The token contract address
         spender_address: The address allowed to spend the tokens
         amount: The amount to approve
+
+    Returns:
+        The encoded approve call
     """
-    print(f"\nApproving token allowance for {token_address} to spender {spender_address}")
-    
-    # Encode the approve function call
-    contract = w3_rpc.eth.contract(address=token_address, abi=ERC20_ABI)
-    data = contract.functions.approve(
-        Web3.to_checksum_address(spender_address),
-        amount
-    ).build_transaction({'gas': 0})['data']
-    
-    # Send the approve transaction via user operation
-    user_op_result = await smart_account.send_user_operation(
-        network=NETWORK,
-        calls=[
-            EncodedCall(
-                to=token_address,
-                data=data,
-                value=0,
-            )
-        ],
-    )
-    
-    print(f"Approval user operation hash: {user_op_result.user_op_hash}")
+    # Encode the approve function call directly: the selector, the spender left-padded
+    # to 32 bytes and the amount as a 32-byte big-endian integer
+    data = "0x" + (
+        APPROVE_SELECTOR
+        + bytes(12) + bytes.fromhex(spender_address[2:])
+        + int(amount).to_bytes(32, "big")
+    ).hex()
     
-    # Wait for approval user operation to be confirmed
-    receipt = await smart_account.wait_for_user_operation(
-        user_op_hash=user_op_result.user_op_hash,
+    return EncodedCall(
+        to=token_address,
+        data=data,
+        value=0,
     )
-    
-    print(f"Approval confirmed with status: {receipt.status} ✅")
 
 
-async def get_allowance(
+@functools.lru_cache(maxsize=64)
+def checksum_address(address: str) -> str:
+    """Checksum an address once; the same few addresses are checked repeatedly."""
+    from web3 import Web3
+
+    return Web3.to_checksum_address(address)
+
+
+@functools.lru_cache(maxsize=64)
+def encode_address(address: str) -> bytes:
+    """ABI-encode an address as a 32-byte call argument once per address."""
+    from eth_abi import encode
+
+    return encode(["address"], [checksum_address(address)])
+
+
+async def multicall_allowance_and_balance(
     owner: str,
     token: str,
-    symbol: str
-) -> int:
+    spender: str
+) -> tuple[int, int]:
     """
-    Check token allowance for the Permit2 contract.
+    Fetch a token's allowance and balance for an owner in one eth_call via Multicall3.
     
     Args:
         owner: The token owner's address (smart account)
         token: The token contract address
-        symbol: The token symbol for logging
+        spender: The address whose allowance is checked (e.g. Permit2)
         
     Returns:
-        The current allowance
+        tuple: (allowance of spender over owner's tokens, owner's token balance)
     """
-    print(f"\nChecking allowance for {symbol} ({token}) to Permit2 contract...")
+    from eth_abi import decode, encode
+
+    token = checksum_address(token)
+    owner_arg = encode_address(owner)
+    calls = [
+        # Call3(target, allowFailure, callData)
+        (token, False, ALLOWANCE_SELECTOR + owner_arg + encode_address(spender)),
+        (token, False, BALANCE_OF_SELECTOR + owner_arg),
+    ]
+    data = AGGREGATE3_SELECTOR + encode(["(address,bool,bytes)[]"], [calls])
     
-    try:
-        contract = w3_rpc.eth.contract(address=token, abi=ERC20_ABI)
-        allowance = contract.functions.allowance(
-            Web3.to_checksum_address(owner),
-            Web3.to_checksum_address(PERMIT2_ADDRESS)
-        ).call()
-        
-        allowance_eth = Web3.from_wei(allowance, 'ether')
-        print(f"Current allowance: {allowance_eth} {symbol}")
-        return allowance
-    except Exception as error:
-        print(f"Error checking allowance: {error}")
-        return 0
+    result = await (await get_w3()).eth.call({"to": MULTICALL3_ADDRESS, "data": "0x" + data.hex()})
+    
+    # aggregate3 returns Result(success, returnData)[]; each returnData is one uint256
+    (results,) = decode(["(bool,bytes)[]"], result)
+    allowance, balance = (decode(["uint256"], return_data)[0] for _, return_data in results)
+    return allowance, balance
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    asyncio.run(run_example(main)) 
\ No newline at end of file
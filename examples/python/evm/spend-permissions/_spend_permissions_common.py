@@ -0,0 +1,57 @@
+"""Shared helpers for the spend permission examples.
+
+account.use_spend_permission.py and smart_account.use_spend_permission.py import
+the permission lookup from here so the two examples stay in sync.
+"""
+
+import asyncio
+import time
+from typing import Any
+
+from cdp import CdpClient
+
+
+async def wait_for_spend_permission(
+    cdp: CdpClient,
+    account_address: str,
+    spender_address: str,
+    timeout_seconds: float = 10.0,
+) -> Any:
+    """Poll until the account lists a spend permission for the spender, and return the latest.
+
+    A permission may not be listed as soon as its user operation completes, so this polls
+    with exponential backoff (0.1s, doubling up to 1s) instead of sleeping a fixed time.
+    Permissions are listed oldest first, so the list is scanned from the end and stops at
+    the first match.
+
+    Args:
+        cdp: The CDP client
+        account_address: The address of the account that granted the permission
+        spender_address: The address of the spender
+        timeout_seconds: How long to wait before giving up
+
+    Returns:
+        The latest listed spend permission for the spender
+
+    Raises:
+        TimeoutError: If no permission for the spender is listed within the timeout
+    """
+    spender_address = spender_address.lower()
+    deadline = time.monotonic() + timeout_seconds
+    delay = 0.1
+    while True:
+        spend_permissions = (await cdp.evm.list_spend_permissions(account_address)).spend_permissions
+        latest = next(
+            (
+                permission
+                for permission in reversed(spend_permissions)
+                if permission.permission.spender == spender_address
+            ),
+            None,
+        )
+        if latest is not None:
+            return latest
+        if time.monotonic() + delay > deadline:
+            raise TimeoutError(f"No spend permission for {spender_address} listed after {timeout_seconds}s")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 1.0)
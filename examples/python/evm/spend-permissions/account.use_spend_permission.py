@@ -1,8 +1,9 @@
 # Usage: uv run python evm/spend-permissions/account.use_spend_permission.py
 
 import asyncio
+import contextlib
 
-from web3 import Web3
+from web3 import AsyncWeb3
 
 from cdp import CdpClient
 from cdp.spend_permissions import SpendPermissionInput
@@ -10,17 +11,40 @@ from cdp.utils import parse_units
 
 from dotenv import load_dotenv
 
-load_dotenv()
+from _spend_permissions_common import wait_for_spend_permission
 
-web3 = Web3(Web3.HTTPProvider("https://sepolia.base.org"))
+# USDC amounts (6 decimals), converted once at import
+ALLOWANCE = parse_units("0.01", 6)  # 0.01 USDC
+SPEND_VALUE = parse_units("0.005", 6)  # 0.005 USDC, half the allowance
+
+# Shared async provider, so receipt polling does not block the event loop and reuses one session
+web3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider("https://sepolia.base.org"))
+
+# Base produces a block every ~2s, so polling for receipts more often only repeats requests
+RECEIPT_POLL_SECONDS = 2.0
+RECEIPT_TIMEOUT_SECONDS = 120
+
+
+async def fund_spender(spender):
+    """Request ETH from the faucet for the spender and wait for it to arrive."""
+    faucet_tx_hash = await spender.request_faucet(
+        network="base-sepolia", token="eth"
+    )
+    print(f"Faucet transaction sent: {faucet_tx_hash}")
+    tx_receipt = await web3.eth.wait_for_transaction_receipt(
+        faucet_tx_hash, timeout=RECEIPT_TIMEOUT_SECONDS, poll_latency=RECEIPT_POLL_SECONDS
+    )
+    print(f"Faucet transaction completed: {tx_receipt.transactionHash}")
 
 
 async def main():
     """Main function to demonstrate using a spend permission with a smart account."""
     async with CdpClient() as cdp:
-        # Create accounts for the example
-        master_owner = await cdp.evm.get_or_create_account(
-            name="Demo-SpendPermissions-Master-Owner"
+        # Create accounts for the example. The spender does not depend on the master
+        # account, so it is fetched alongside the master's owner.
+        master_owner, spender = await asyncio.gather(
+            cdp.evm.get_or_create_account(name="Demo-SpendPermissions-Master-Owner"),
+            cdp.evm.get_or_create_account(name="Demo-SpendPermissions-EOA-Spender"),
         )
         master = await cdp.evm.get_or_create_smart_account(
             name="Demo-SpendPermissions-Master",
@@ -28,17 +52,6 @@ async def main():
             enable_spend_permissions=True,
         )
 
-        spender = await cdp.evm.get_or_create_account(
-            name="Demo-SpendPermissions-EOA-Spender"
-        )
-
-        faucet_tx_hash = await spender.request_faucet(
-            network="base-sepolia", token="eth"
-        )
-        print(f"Faucet transaction sent: {faucet_tx_hash}")
-        tx_receipt = web3.eth.wait_for_transaction_receipt(faucet_tx_hash)
-        print(f"Faucet transaction completed: {tx_receipt.transactionHash}")
-
         print(f"Master account: {master.address}")
         print(f"Spender account: {spender.address}")
 
@@ -46,48 +59,54 @@ async def main():
             account=master.address,
             spender=spender.address,
             token="usdc",
-            allowance=parse_units("0.01", 6),
+            allowance=ALLOWANCE,
             period_in_days=1,
         )
 
-        # Create the spend permission onchain
-        user_operation = await cdp.evm.create_spend_permission(
-            spend_permission=spend_permission,
-            network="base-sepolia",
-        )
-        print(
-            f"Created spend permission with user operation hash: {user_operation.user_op_hash}"
-        )
-
-        # Wait for the user operation to complete
-        result = await cdp.evm.wait_for_user_operation(
-            smart_account_address=master.address,
-            user_op_hash=user_operation.user_op_hash,
-        )
-        print(f"User operation completed with status: {result.status}")
-
-        # Sleep 2 seconds
-        await asyncio.sleep(2)
-
-        all_permissions = await cdp.evm.list_spend_permissions(master.address)
-        permissions = [
-            permission
-            for permission in all_permissions.spend_permissions
-            if permission.permission.spender == spender.address.lower()
-        ]
+        # The spender only needs gas for the spend, so it is funded while the permission is created
+        faucet_task = asyncio.create_task(fund_spender(spender))
+        try:
+            # Create the spend permission onchain
+            user_operation = await cdp.evm.create_spend_permission(
+                spend_permission=spend_permission,
+                network="base-sepolia",
+            )
+            print(
+                f"Created spend permission with user operation hash: {user_operation.user_op_hash}"
+            )
+
+            # Wait for the user operation to complete
+            result = await cdp.evm.wait_for_user_operation(
+                smart_account_address=master.address,
+                user_op_hash=user_operation.user_op_hash,
+            )
+            print(f"User operation completed with status: {result.status}")
+
+            # Wait until the new permission is listed
+            latest_permission = await wait_for_spend_permission(cdp, master.address, spender.address)
+
+            await faucet_task
+        finally:
+            # If the permission could not be created, stop the faucet request rather than orphan it
+            if not faucet_task.done():
+                faucet_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await faucet_task
 
         print("Executing spend...")
 
         # Use the spend permission
         spend_tx_hash = await spender.use_spend_permission(
-            spend_permission=permissions[-1].permission,
-            value=parse_units("0.005", 6),  # Spend 0.005 USDC (half the allowance)
+            spend_permission=latest_permission.permission,
+            value=SPEND_VALUE,  # Spend 0.005 USDC (half the allowance)
             network="base-sepolia",
         )
 
         print(f"Spend sent, waiting for receipt... {spend_tx_hash}")
 
-        tx_receipt = web3.eth.wait_for_transaction_receipt(spend_tx_hash)
+        tx_receipt = await web3.eth.wait_for_transaction_receipt(
+            spend_tx_hash, timeout=RECEIPT_TIMEOUT_SECONDS, poll_latency=RECEIPT_POLL_SECONDS
+        )
 
         print("Spend completed!")
         print(
@@ -95,5 +114,14 @@ async def main():
         )
 
 
+async def run():
+    """Run the example and close the web3 provider's session afterwards."""
+    try:
+        await main()
+    finally:
+        await web3.provider.disconnect()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    load_dotenv()
+    asyncio.run(run())
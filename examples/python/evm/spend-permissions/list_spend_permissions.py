@@ -57,11 +57,12 @@ async def main():
 
         # List the spend permissions
         permissions = await cdp.evm.list_spend_permissions(account.address)
-        # filter permissions by spender
+        # filter permissions by spender (listed spender addresses are lowercase)
+        spender_address = spender.address.lower()
         permissions = [
             permission
             for permission in permissions.spend_permissions
-            if permission.permission.spender == spender.address.lower()
+            if permission.permission.spender == spender_address
         ]
         print(permissions)
 
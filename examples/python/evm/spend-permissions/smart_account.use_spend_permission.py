@@ -1,6 +1,7 @@
 # Usage: uv run python evm/spend-permissions/smart_account.use_spend_permission.py
 
 import asyncio
+import contextlib
 import sys
 
 from cdp import CdpClient
@@ -9,78 +10,95 @@ from cdp.utils import parse_units
 
 from dotenv import load_dotenv
 
-load_dotenv()
+from _spend_permissions_common import wait_for_spend_permission
+
+# USDC amounts (6 decimals), converted once at import
+ALLOWANCE = parse_units("0.01", 6)  # 0.01 USDC
+SPEND_VALUE = parse_units("0.005", 6)  # 0.005 USDC, half the allowance
+
+# Pass --faucet to fund the account with USDC before creating the permission
+USE_FAUCET = "--faucet" in sys.argv
 
 
 async def main():
     """Main function to demonstrate using a spend permission with a smart account."""
     async with CdpClient() as cdp:
-        # Create accounts for the example
-        account = await cdp.evm.get_or_create_smart_account(
-            name="Demo-SpendPermissions-Account",
-            owner=await cdp.evm.get_or_create_account(
-                name="Demo-SpendPermissions-Account-Owner"
-            ),
-            enable_spend_permissions=True,
+        # Create accounts for the example. The account and spender are independent, so
+        # both owners are fetched together, then both smart accounts.
+        account_owner, spender_owner = await asyncio.gather(
+            cdp.evm.get_or_create_account(name="Demo-SpendPermissions-Account-Owner"),
+            cdp.evm.get_or_create_account(name="Demo-SpendPermissions-Spender-Owner"),
         )
 
-        spender = await cdp.evm.get_or_create_smart_account(
-            name="Demo-SpendPermissions-Spender",
-            owner=await cdp.evm.get_or_create_account(
-                name="Demo-SpendPermissions-Spender-Owner",
+        account, spender = await asyncio.gather(
+            cdp.evm.get_or_create_smart_account(
+                name="Demo-SpendPermissions-Account",
+                owner=account_owner,
+                enable_spend_permissions=True,
+            ),
+            cdp.evm.get_or_create_smart_account(
+                name="Demo-SpendPermissions-Spender",
+                owner=spender_owner,
             ),
         )
 
         print(f"Account: {account.address}")
         print(f"Spender account: {spender.address}")
 
-        # Fund the grantor with USDC if --faucet flag is provided
-        if "--faucet" in sys.argv:
-            await account.request_faucet(
-                network="base-sepolia",
-                token="usdc",
+        # Fund the grantor with USDC if --faucet flag is provided. The funds are only needed
+        # for the spend, so the faucet request runs while the permission is created.
+        faucet_task = None
+        if USE_FAUCET:
+            faucet_task = asyncio.create_task(
+                account.request_faucet(
+                    network="base-sepolia",
+                    token="usdc",
+                )
             )
 
         spend_permission = SpendPermissionInput(
             account=account.address,
             spender=spender.address,
             token="usdc",  # USDC on base-sepolia
-            allowance=parse_units("0.01", 6),  # 0.01 USDC
+            allowance=ALLOWANCE,  # 0.01 USDC
             period_in_days=1,  # 1 day (much clearer than 86400 seconds!)
         )
 
-        # Create the spend permission on-chain
-        user_operation = await cdp.evm.create_spend_permission(
-            spend_permission=spend_permission,
-            network="base-sepolia",
-        )
-        print(
-            f"Created spend permission with user operation hash: {user_operation.user_op_hash}"
-        )
+        try:
+            # Create the spend permission on-chain
+            user_operation = await cdp.evm.create_spend_permission(
+                spend_permission=spend_permission,
+                network="base-sepolia",
+            )
+            print(
+                f"Created spend permission with user operation hash: {user_operation.user_op_hash}"
+            )
 
-        # Wait for the user operation to complete
-        result = await cdp.evm.wait_for_user_operation(
-            smart_account_address=account.address,
-            user_op_hash=user_operation.user_op_hash,
-        )
-        print(f"User operation completed with status: {result.status}")
+            # Wait for the user operation to complete
+            result = await cdp.evm.wait_for_user_operation(
+                smart_account_address=account.address,
+                user_op_hash=user_operation.user_op_hash,
+            )
+            print(f"User operation completed with status: {result.status}")
 
-        # Sleep 2 seconds
-        await asyncio.sleep(2)
+            # Wait until the new permission is listed
+            latest_permission = await wait_for_spend_permission(cdp, account.address, spender.address)
 
-        all_permissions = await cdp.evm.list_spend_permissions(account.address)
-        permissions = [
-            permission
-            for permission in all_permissions.spend_permissions
-            if permission.permission.spender == spender.address.lower()
-        ]
+            if faucet_task is not None:
+                await faucet_task
+        finally:
+            # If the permission could not be created, stop the faucet request rather than orphan it
+            if faucet_task is not None and not faucet_task.done():
+                faucet_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await faucet_task
 
         print("Executing spend...")
 
         # Use the spend permission
         spend_result = await spender.use_spend_permission(
-            spend_permission=permissions[-1].permission,  # Use the latest permission
-            value=parse_units("0.005", 6),  # Spend 0.005 USDC
+            spend_permission=latest_permission.permission,  # Use the latest permission
+            value=SPEND_VALUE,  # Spend 0.005 USDC
             network="base-sepolia",
         )
 
@@ -98,4 +116,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    load_dotenv()
     asyncio.run(main())
@@ -0,0 +1,359 @@
+"""Shared helpers for the account swap examples.
+
+account.swap.py, account.quote_swap.py and account.quote_swap_and_execute.py import
+their token definitions, output buffering, Base RPC access and Permit2 allowance
+handling from here so the three examples stay in sync.
+"""
+
+import asyncio
+import functools
+import sys
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+
+import aiohttp
+from cdp.evm_transaction_types import TransactionRequestEIP1559
+from eth_abi import decode, encode
+from web3 import AsyncWeb3, Web3
+from web3.exceptions import TransactionNotFound
+
+# Network configuration
+NETWORK = "base"  # Base mainnet
+
+
+@dataclass(frozen=True, slots=True)
+class Token:
+    """A token used in the examples."""
+
+    address: str
+    symbol: str
+    decimals: int
+    is_native_asset: bool
+
+
+# Token definitions for the examples (using Base mainnet token addresses)
+TOKENS = {
+    "WETH": Token(
+        address="0x4200000000000000000000000000000000000006",
+        symbol="WETH",
+        decimals=18,
+        is_native_asset=False,
+    ),
+    "USDC": Token(
+        address="0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+        symbol="USDC",
+        decimals=6,
+        is_native_asset=False,
+    ),
+}
+
+# Permit2 contract address is the same across all networks
+PERMIT2_ADDRESS = "0x000000000022D473030F116dDEE9F6B43aC78BA3"
+
+# Pass --approve-max to approve Permit2 for the maximum uint256 amount, so later swaps of the
+# token need no further approval. By default only the swap amount is approved.
+APPROVE_MAX = "--approve-max" in sys.argv
+MAX_UINT256 = (1 << 256) - 1
+
+# Base mainnet RPC endpoint used for allowance reads and transaction receipt polling
+RPC_URL = "https://mainnet.base.org"
+
+# Async Web3 instance for RPC_URL, created on first use
+_w3_rpc: AsyncWeb3 | None = None
+
+# Receipt polling starts quickly and backs off to roughly the Base block time (~2s)
+RECEIPT_POLL_START_SECONDS = 0.25
+RECEIPT_POLL_MAX_SECONDS = 2.0
+RECEIPT_TIMEOUT_SECONDS = 120
+
+# Multicall3 is deployed at the same address on all major networks, including Base
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Function selectors for approve(address,uint256), allowance(address,address) and balanceOf(address)
+APPROVE_SELECTOR = bytes.fromhex("095ea7b3")
+ALLOWANCE_SELECTOR = bytes.fromhex("dd62ed3e")
+BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")
+
+# Function selector for Multicall3 aggregate3((address,bool,bytes)[])
+AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")
+
+# Lines passed to log() that have not been written yet; the quote details and
+# validation results are each written in one go
+_log_buffer: list[str] = []
+
+
+def log(message: str = "") -> None:
+    """Buffer a line of output until the next flush_log()."""
+    _log_buffer.append(message)
+
+
+def flush_log() -> None:
+    """Write all buffered lines to stdout in a single write."""
+    if _log_buffer:
+        sys.stdout.write("\n".join(_log_buffer) + "\n")
+        _log_buffer.clear()
+
+
+async def get_w3() -> AsyncWeb3:
+    """Return the shared AsyncWeb3 instance, creating it on first use.
+
+    The provider is given one keep-alive session, so every RPC call reuses open connections.
+    """
+    global _w3_rpc
+    if _w3_rpc is None:
+        w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(RPC_URL, request_kwargs={"timeout": 30}))
+        await w3.provider.cache_async_session(
+            aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        )
+        _w3_rpc = w3
+    return _w3_rpc
+
+
+async def close_w3():
+    """Close the AsyncWeb3 provider's HTTP session, if it was created."""
+    global _w3_rpc
+    if _w3_rpc is not None:
+        await _w3_rpc.provider.disconnect()
+        _w3_rpc = None
+
+
+async def run_example(main) -> None:
+    """Run an example's main(), then flush its output and close the Web3 provider's session."""
+    try:
+        await main()
+    finally:
+        flush_log()
+        await close_w3()
+
+
+@functools.lru_cache(maxsize=None)
+def decimal_scale(decimals: int) -> Decimal:
+    """Return 10**decimals as a Decimal, computed once per number of decimals."""
+    return Decimal(10) ** decimals
+
+
+def to_decimal(amount: int | str, decimals: int) -> Decimal:
+    """Convert an amount in smallest units to whole tokens."""
+    return Decimal(amount) / decimal_scale(decimals)
+
+
+@functools.lru_cache(maxsize=64)
+def checksum_address(address: str) -> str:
+    """Checksum an address once; the same few addresses are checked repeatedly."""
+    return Web3.to_checksum_address(address)
+
+
+@functools.lru_cache(maxsize=64)
+def encode_address(address: str) -> bytes:
+    """ABI-encode an address as a 32-byte call argument once per address."""
+    return encode(["address"], [checksum_address(address)])
+
+
+async def wait_for_receipt(tx_hash: str):
+    """Poll for a transaction receipt, backing off from 250ms up to the Base block time.
+
+    Args:
+        tx_hash: The hash of the submitted transaction
+
+    Returns:
+        The transaction receipt
+
+    Raises:
+        TimeoutError: If the transaction is not mined within RECEIPT_TIMEOUT_SECONDS
+    """
+    w3 = await get_w3()
+    deadline = time.monotonic() + RECEIPT_TIMEOUT_SECONDS
+    delay = RECEIPT_POLL_START_SECONDS
+    while True:
+        try:
+            return await w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            pass
+        if time.monotonic() + delay > deadline:
+            raise TimeoutError(f"Transaction {tx_hash} not mined after {RECEIPT_TIMEOUT_SECONDS}s")
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.5, RECEIPT_POLL_MAX_SECONDS)
+
+
+async def multicall_allowance_and_balance(owner: str, token: str, spender: str) -> tuple[int, int]:
+    """Fetch a token's allowance and balance for an owner in one eth_call via Multicall3.
+
+    Args:
+        owner: The token owner's address
+        token: The token contract address
+        spender: The address whose allowance is checked (e.g. Permit2)
+
+    Returns:
+        tuple: (allowance of spender over owner's tokens, owner's token balance)
+    """
+    token = checksum_address(token)
+    owner_arg = encode_address(owner)
+    calls = [
+        # Call3(target, allowFailure, callData)
+        (token, False, ALLOWANCE_SELECTOR + owner_arg + encode_address(spender)),
+        (token, False, BALANCE_OF_SELECTOR + owner_arg),
+    ]
+    data = AGGREGATE3_SELECTOR + encode(["(address,bool,bytes)[]"], [calls])
+
+    result = await (await get_w3()).eth.call({"to": MULTICALL3_ADDRESS, "data": "0x" + data.hex()})
+
+    # aggregate3 returns Result(success, returnData)[]; each returnData is one uint256,
+    # so it is read directly as a big-endian integer
+    (results,) = decode(["(bool,bytes)[]"], result)
+    allowance, balance = (int.from_bytes(return_data, "big") for _, return_data in results)
+    return allowance, balance
+
+
+async def get_allowance_and_balance(account, token: Token) -> tuple[int, int | None]:
+    """Check token allowance for the Permit2 contract and the account's token balance.
+
+    Both reads are made in a single eth_call through Multicall3.
+
+    Args:
+        account: The account that owns the tokens
+        token: The token to check
+
+    Returns:
+        tuple: (current allowance in smallest units, balance in smallest units or None if unknown)
+    """
+    print(f"\nChecking allowance for {token.symbol} ({token.address}) to Permit2 contract...")
+    print("🌐 Making read-only Multicall3 call via Web3.py...")
+
+    try:
+        return await multicall_allowance_and_balance(account.address, token.address, PERMIT2_ADDRESS)
+    except Exception as call_error:
+        print(f"❌ Web3 contract call failed: {call_error}")
+        print("🔄 For demo purposes, returning 0 to trigger approval flow...")
+        return 0, None
+
+
+async def approve_token_allowance(account, token: Token, spender_address: str, amount: int | str):
+    """Send an approve transaction for the token and wait for it to be mined.
+
+    This is necessary when swapping ERC20 tokens (not native ETH).
+    The Permit2 contract needs approval to move tokens on your behalf.
+
+    Args:
+        account: The account that owns the tokens
+        token: The token to approve
+        spender_address: The address allowed to spend the tokens (Permit2)
+        amount: The amount to approve (in smallest units, as a string or int)
+
+    Returns:
+        The approval transaction hash
+    """
+    print(f"\nApproving token allowance for {token.address} to spender {spender_address}")
+
+    try:
+        # Encode the approve function call directly (selector + ABI-encoded arguments)
+        call_data = "0x" + (
+            APPROVE_SELECTOR + encode_address(spender_address) + int(amount).to_bytes(32, "big")
+        ).hex()
+
+        print(f"Sending approval transaction for {token.symbol}...")
+
+        try:
+            # Use CDP SDK to send the approval transaction
+            result = await account.send_transaction(
+                transaction=TransactionRequestEIP1559(
+                    to=token.address,
+                    data=call_data,
+                    value=0,  # No ETH value for approve
+                ),
+                network=NETWORK,
+            )
+
+            print("✅ Approval transaction submitted!")
+            print(f"Transaction hash: {result}")
+            print(f"🔗 View on explorer: https://basescan.org/tx/{result}")
+            print("⏳ Waiting for transaction confirmation...")
+
+            # Wait for transaction confirmation using Web3.py
+            try:
+                tx_receipt = await wait_for_receipt(result)
+
+                print(f"✅ Approval transaction confirmed in block {tx_receipt.blockNumber}!")
+                print(f"📊 Transaction status: {'Success' if tx_receipt.status == 1 else 'Failed'}")
+                print(f"⛽ Gas used: {tx_receipt.gasUsed:,}")
+                print(f"🎉 {token.symbol} can now be spent by Permit2")
+                return result
+
+            except Exception as receipt_error:
+                print(f"⚠️ Could not wait for transaction receipt: {receipt_error}")
+                print("Transaction was submitted but confirmation status unknown.")
+                print("Check the explorer link above to verify transaction status.")
+                return result
+
+        except Exception as tx_error:
+            print(f"❌ Transaction submission failed: {tx_error}")
+            print("This might be because:")
+            print("- Insufficient funds for gas")
+            print("- Network connectivity issues")
+            print("- Invalid transaction data")
+            raise tx_error
+
+    except Exception as error:
+        print(f"Error approving allowance: {error}")
+        raise error
+
+
+async def handle_token_allowance(
+    account,
+    token: Token,
+    from_amount: int | str,
+    current_allowance: int,
+    balance: int | None,
+):
+    """Approve Permit2 for the token if the current allowance is too low.
+
+    This is necessary when swapping ERC20 tokens (not native ETH).
+    The Permit2 contract needs approval to move tokens on your behalf.
+
+    Args:
+        account: The account that owns the tokens
+        token: The token to be sent
+        from_amount: The amount to be sent, in smallest units
+        current_allowance: The Permit2 allowance read by get_allowance_and_balance
+        balance: The account's token balance, or None if it could not be read
+
+    Raises:
+        ValueError: If the account's token balance is below from_amount
+    """
+    # Turn away a swap the account cannot cover before approving
+    required_amount = int(from_amount)
+    if balance is not None and balance < required_amount:
+        raise ValueError(
+            f"Insufficient {token.symbol} balance. "
+            f"Current: {to_decimal(balance, token.decimals):.6f}, "
+            f"Required: {to_decimal(required_amount, token.decimals):.6f}"
+        )
+
+    # Check if allowance is sufficient
+    allowance_formatted = to_decimal(current_allowance, token.decimals)
+    required_formatted = to_decimal(required_amount, token.decimals)
+    if current_allowance < required_amount:
+        print(
+            f"❌ Allowance insufficient. Current: {allowance_formatted:.6f}, "
+            f"Required: {required_formatted:.6f}"
+        )
+
+        # Approve the required amount, or the maximum if requested
+        await approve_token_allowance(
+            account,
+            token,
+            PERMIT2_ADDRESS,
+            MAX_UINT256 if APPROVE_MAX else required_amount,
+        )
+
+        if APPROVE_MAX:
+            print(f"✅ Set allowance to the maximum for {token.symbol}")
+        else:
+            print(f"✅ Set allowance to {required_formatted:.6f} {token.symbol}")
+    else:
+        print(
+            f"✅ Token allowance sufficient. Current: {allowance_formatted:.6f} {token.symbol}, "
+            f"Required: {required_formatted:.6f} {token.symbol}"
+        )
@@ -36,62 +36,16 @@ need more control over the process.
 """
 
 import asyncio
-from decimal import Decimal
 
 from cdp import CdpClient
 from cdp.actions.evm.swap import AccountSwapOptions
 
 from cdp.utils import parse_units
 from dotenv import load_dotenv
-from web3 import Web3
 
-load_dotenv()
+from _swap_common import NETWORK, TOKENS, Token, flush_log, log, run_example, to_decimal
 
-# Network configuration
-NETWORK = "base"  # Base mainnet
-
-# Token definitions for the example (using Base mainnet token addresses)
-TOKENS = {
-    "WETH": {
-        "address": "0x4200000000000000000000000000000000000006",
-        "symbol": "WETH",
-        "decimals": 18,
-        "is_native_asset": False
-    },
-    "USDC": {
-        "address": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
-        "symbol": "USDC",
-        "decimals": 6,
-        "is_native_asset": False
-    },
-}
-
-# Permit2 contract address is the same across all networks
-PERMIT2_ADDRESS = "0x000000000022D473030F116dDEE9F6B43aC78BA3"
-
-# ERC20 ABI for allowance and approve functions
-ERC20_ABI = [
-    {
-        "constant": True,
-        "inputs": [
-            {"name": "owner", "type": "address"},
-            {"name": "spender", "type": "address"}
-        ],
-        "name": "allowance",
-        "outputs": [{"name": "", "type": "uint256"}],
-        "type": "function"
-    },
-    {
-        "constant": False,
-        "inputs": [
-            {"name": "spender", "type": "address"},
-            {"name": "amount", "type": "uint256"}
-        ],
-        "name": "approve",
-        "outputs": [{"name": "", "type": "bool"}],
-        "type": "function"
-    }
-]
+load_dotenv()
 
 
 async def main():
@@ -109,16 +63,16 @@ async def main():
             to_token = TOKENS["USDC"]
             
             # Set the amount we want to send
-            from_amount = parse_units("0.1", from_token["decimals"])  # 0.1 WETH
+            from_amount = parse_units("0.1", from_token.decimals)  # 0.1 WETH
             
-            from_amount_decimal = Decimal(from_amount) / Decimal(10 ** from_token["decimals"])
-            print(f"\nCreating a swap quote for {from_amount_decimal:.6f} {from_token['symbol']} to {to_token['symbol']}")
+            from_amount_decimal = to_decimal(from_amount, from_token.decimals)
+            print(f"\nCreating a swap quote for {from_amount_decimal:.6f} {from_token.symbol} to {to_token.symbol}")
             
             # Create the swap quote using the account's quote_swap method
             print("\nFetching swap quote using account.quote_swap()...")
             swap_quote = await account.quote_swap(
-                from_token=from_token["address"],
-                to_token=to_token["address"],
+                from_token=from_token.address,
+                to_token=to_token.address,
                 from_amount=from_amount,
                 network=NETWORK,
                 slippage_bps=100,  # 1% slippage tolerance
@@ -159,7 +113,7 @@ async def main():
             print(f"Error creating swap quote: {error}")
 
 
-def log_swap_info(swap_quote, from_token: dict, to_token: dict):
+def log_swap_info(swap_quote, from_token: Token, to_token: Token):
     """Log information about the swap.
     
     Args:
@@ -167,51 +121,56 @@ def log_swap_info(swap_quote, from_token: dict, to_token: dict):
         from_token: The token being sent
         to_token: The token being received
     """
-    print("\nSwap Quote Details:")
-    print("-------------------")
+    log("\nSwap Quote Details:")
+    log("-------------------")
     
     # Convert amounts to readable format
-    from_amount_decimal = Decimal(swap_quote.from_amount) / Decimal(10 ** from_token["decimals"])
-    to_amount_decimal = Decimal(swap_quote.to_amount) / Decimal(10 ** to_token["decimals"])
-    min_to_amount_decimal = Decimal(swap_quote.min_to_amount) / Decimal(10 ** to_token["decimals"])
+    from_amount_decimal = to_decimal(swap_quote.from_amount, from_token.decimals)
+    to_amount_decimal = to_decimal(swap_quote.to_amount, to_token.decimals)
+    min_to_amount_decimal = to_decimal(swap_quote.min_to_amount, to_token.decimals)
     
-    print(f"Receive Amount: {to_amount_decimal:.{to_token['decimals']}} {to_token['symbol']}")
-    print(f"Min Receive Amount: {min_to_amount_decimal:.{to_token['decimals']}} {to_token['symbol']}")
-    print(f"Send Amount: {from_amount_decimal:.{from_token['decimals']}} {from_token['symbol']}")
+    log(f"Receive Amount: {to_amount_decimal:.{to_token.decimals}} {to_token.symbol}")
+    log(f"Min Receive Amount: {min_to_amount_decimal:.{to_token.decimals}} {to_token.symbol}")
+    log(f"Send Amount: {from_amount_decimal:.{from_token.decimals}} {from_token.symbol}")
     
-    # Calculate and display price ratios
+    # Calculate and display price ratios. The rates stay Decimal so they are exact to
+    # each token's decimals; a float would round them to ~17 significant digits
     # Calculate exchange rate: How many to_tokens per 1 from_token
-    from_to_to_rate = float(to_amount_decimal / from_amount_decimal)
+    from_to_to_rate = to_amount_decimal / from_amount_decimal
     
     # Calculate minimum exchange rate with slippage applied
-    min_from_to_to_rate = float(min_to_amount_decimal / from_amount_decimal)
+    min_from_to_to_rate = min_to_amount_decimal / from_amount_decimal
     
     # Calculate maximum to_token to from_token ratio with slippage
-    max_to_to_from_rate = float(from_amount_decimal / min_to_amount_decimal)
+    max_to_to_from_rate = from_amount_decimal / min_to_amount_decimal
 
     # Calculate exchange rate: How many from_tokens per 1 to_token
-    to_to_from_rate = float(from_amount_decimal / to_amount_decimal)
+    to_to_from_rate = from_amount_decimal / to_amount_decimal
     
-    print("\nToken Price Calculations:")
-    print("------------------------")
-    print(f"1 {from_token['symbol']} = {from_to_to_rate:.{to_token['decimals']}} {to_token['symbol']}")
-    print(f"1 {to_token['symbol']} = {to_to_from_rate:.{from_token['decimals']}} {from_token['symbol']}")
+    log("\nToken Price Calculations:")
+    log("------------------------")
+    log(f"1 {from_token.symbol} = {from_to_to_rate:.{to_token.decimals}f} {to_token.symbol}")
+    log(f"1 {to_token.symbol} = {to_to_from_rate:.{from_token.decimals}f} {from_token.symbol}")
     
     # Calculate effective exchange rate with slippage applied
-    print("\nWith Slippage Applied (Worst Case):")
-    print("----------------------------------")
-    print(f"1 {from_token['symbol']} = {min_from_to_to_rate:.{to_token['decimals']}} {to_token['symbol']} (minimum)")
-    print(f"1 {to_token['symbol']} = {max_to_to_from_rate:.{from_token['decimals']}} {from_token['symbol']} (maximum)")
+    log("\nWith Slippage Applied (Worst Case):")
+    log("----------------------------------")
+    log(f"1 {from_token.symbol} = {min_from_to_to_rate:.{to_token.decimals}f} {to_token.symbol} (minimum)")
+    log(f"1 {to_token.symbol} = {max_to_to_from_rate:.{from_token.decimals}f} {from_token.symbol} (maximum)")
     
     price_impact = ((from_to_to_rate - min_from_to_to_rate) / from_to_to_rate * 100) if from_to_to_rate > 0 else 0
-    print(f"Maximum price impact: {price_impact:.2f}%")
+    log(f"Maximum price impact: {price_impact:.2f}%")
+    
+    log("\nSuggested Gas Details:")
+    log("----------------------------------")
+    gas_limit = getattr(swap_quote, 'gas_limit', None)
+    if gas_limit:
+        log(f"Gas: {gas_limit}")
+    gas_price = getattr(swap_quote, 'gas_price', None)
+    if gas_price:
+        log(f"Gas Price: {gas_price}")
     
-    print("\nSuggested Gas Details:")
-    print("----------------------------------")
-    if hasattr(swap_quote, 'gas_limit') and swap_quote.gas_limit:
-        print(f"Gas: {swap_quote.gas_limit}")
-    if hasattr(swap_quote, 'gas_price') and swap_quote.gas_price:
-        print(f"Gas Price: {swap_quote.gas_price}")
+    flush_log()
 
 
 def validate_swap(swap_quote) -> bool:
@@ -223,30 +182,31 @@ def validate_swap(swap_quote) -> bool:
     Returns:
         bool: True if swap is valid, False if there are issues
     """
-    print("\nValidating Swap Quote:")
-    print("---------------------")
+    log("\nValidating Swap Quote:")
+    log("---------------------")
     
     # Since we already checked for SwapUnavailableResult above, we know liquidity is available
-    print("✅ Liquidity available")
+    log("✅ Liquidity available")
     
     # Check for balance issues (this would need to be implemented based on the actual quote structure)
     # if hasattr(swap_quote, 'issues') and hasattr(swap_quote.issues, 'balance') and swap_quote.issues.balance:
-    #     print("\n❌ Balance Issues:")
-    #     print(f"Current Balance: {swap_quote.issues.balance.current_balance}")
-    #     print(f"Required Balance: {swap_quote.issues.balance.required_balance}")
-    #     print(f"Token: {swap_quote.issues.balance.token}")
-    #     print("\nInsufficient balance. Please add funds to your account.")
+    #     log("\n❌ Balance Issues:")
+    #     log(f"Current Balance: {swap_quote.issues.balance.current_balance}")
+    #     log(f"Required Balance: {swap_quote.issues.balance.required_balance}")
+    #     log(f"Token: {swap_quote.issues.balance.token}")
+    #     log("\nInsufficient balance. Please add funds to your account.")
     #     return False
     # else:
-    print("✅ Sufficient balance")
+    log("✅ Sufficient balance")
 
     # if hasattr(swap_quote, 'issues') and hasattr(swap_quote.issues, 'simulation_incomplete') and swap_quote.issues.simulation_incomplete:
-    #     print("⚠️ WARNING: Simulation incomplete. Transaction may fail.")
+    #     log("⚠️ WARNING: Simulation incomplete. Transaction may fail.")
     # else:
-    print("✅ Simulation complete")
+    log("✅ Simulation complete")
     
+    flush_log()
     return True
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(run_example(main))
\ No newline at end of file
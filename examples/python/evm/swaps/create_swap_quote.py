@@ -22,6 +22,10 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Token unit scales, built once instead of on every conversion
+USDC_SCALE = Decimal(10) ** 6
+WETH_SCALE = Decimal(10) ** 18
+
 
 async def main():
     """Create a swap quote and execute it."""
@@ -53,17 +57,19 @@ async def main():
             print("   Try a smaller amount or a different token pair")
             return
         
+        # Convert the amounts once; they are used for display and the exchange rate
+        from_amount_decimal = Decimal(quote.from_amount) / USDC_SCALE
+        to_amount_decimal = Decimal(quote.to_amount) / WETH_SCALE
+        
         # Display the quote details
         print("\n📊 Swap Quote Details:")
         print(f"   Quote ID: {quote.quote_id}")
-        print(f"   Selling: {Decimal(quote.from_amount) / Decimal(10**6):.2f} USDC")
-        print(f"   Expected output: {Decimal(quote.to_amount) / Decimal(10**18):.6f} WETH")
-        print(f"   Minimum output: {Decimal(quote.min_to_amount) / Decimal(10**18):.6f} WETH")
+        print(f"   Selling: {from_amount_decimal:.2f} USDC")
+        print(f"   Expected output: {to_amount_decimal:.6f} WETH")
+        print(f"   Minimum output: {Decimal(quote.min_to_amount) / WETH_SCALE:.6f} WETH")
         print(f"   Max slippage: 1%")
         
         # Calculate the exchange rate
-        from_amount_decimal = Decimal(quote.from_amount) / Decimal(10**6)
-        to_amount_decimal = Decimal(quote.to_amount) / Decimal(10**18)
         rate = to_amount_decimal / from_amount_decimal
         print(f"   Exchange rate: 1 USDC = {rate:.8f} WETH")
         
@@ -18,6 +18,10 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Token unit scales, built once instead of on every conversion
+USDC_SCALE = Decimal(10) ** 6
+WETH_SCALE = Decimal(10) ** 18
+
 
 async def main():
     """Get a swap price quote."""
@@ -46,15 +50,17 @@ async def main():
                 taker=account.address  # Address where the from_token balance is located
             )
             
+            # Convert the amounts once; they are used for display and the price
+            from_amount_decimal = Decimal(priceQuote.from_amount) / USDC_SCALE
+            to_amount_decimal = Decimal(priceQuote.to_amount) / WETH_SCALE
+            
             # Display the price quote details
             print("📊 Price Quote:")
             print(f"   Quote ID: {priceQuote.quote_id}")
-            print(f"   From: {Decimal(priceQuote.from_amount) / Decimal(10**6):.2f} USDC")
-            print(f"   To: {Decimal(priceQuote.to_amount) / Decimal(10**18):.6f} WETH")
+            print(f"   From: {from_amount_decimal:.2f} USDC")
+            print(f"   To: {to_amount_decimal:.6f} WETH")
             
             # Calculate and display the price
-            from_amount_decimal = Decimal(priceQuote.from_amount) / Decimal(10**6)
-            to_amount_decimal = Decimal(priceQuote.to_amount) / Decimal(10**18)
             price_per_usdc = to_amount_decimal / from_amount_decimal
             
             print(f"   Price: 1 USDC = {price_per_usdc:.8f} WETH")
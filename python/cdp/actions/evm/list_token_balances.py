@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+
 from cdp.evm_token_balances import (
     EvmToken,
     EvmTokenAmount,
@@ -48,3 +50,34 @@ async def list_token_balances(
         ],
         next_page_token=response.next_page_token,
     )
+
+
+async def list_token_balances_stream(
+    onchain_data: OnchainDataApi,
+    address: str,
+    network: str,
+    page_size: int | None = None,
+) -> AsyncIterator[EvmTokenBalance]:
+    """Yield the token balances for an address on a given network, one page at a time.
+
+    Each page is requested only after the previous one has been consumed, so the first
+    balances are available after a single request and only one page is held in memory.
+
+    Args:
+        onchain_data (OnchainDataApi): The onchain data API.
+        address (str): The address to list the token balances for.
+        network (str): The network to list the token balances for.
+        page_size (int, optional): The number of token balances to request per page. Defaults to None.
+
+    Yields:
+        EvmTokenBalance: The token balances for the address.
+
+    """
+    page_token = None
+    while True:
+        result = await list_token_balances(onchain_data, address, network, page_size, page_token)
+        for balance in result.balances:
+            yield balance
+        page_token = result.next_page_token
+        if not page_token:
+            return
@@ -4,6 +4,7 @@ This module provides functionality for signing EIP-712 typed data with Coinbase
 handling the specific requirements of the smart contract implementation.
 """
 
+import functools
 from typing import Any
 
 from eth_abi import encode
@@ -186,6 +187,25 @@ async def sign_and_wrap_typed_data_for_smart_account(
     return SignAndWrapTypedDataForSmartAccountResult(signature=wrapped_signature)
 
 
+@functools.lru_cache(maxsize=64)
+def _hash_domain(domain_items: tuple[tuple[str, Any], ...]) -> bytes:
+    """Compute the EIP-712 domain separator for a domain given as sorted (key, value) pairs.
+
+    A domain such as Permit2's is constant per network, so repeated signatures reuse the
+    cached separator instead of re-encoding and re-hashing the domain.
+
+    Args:
+        domain_items: The domain fields as sorted (key, value) pairs
+
+    Returns:
+        bytes: The 32-byte domain separator
+
+    """
+    from eth_account._utils.encode_typed_data import hash_domain
+
+    return hash_domain(dict(domain_items))
+
+
 def create_replay_safe_typed_data(
     typed_data: dict[str, Any],
     chain_id: int,
@@ -210,12 +230,11 @@ def create_replay_safe_typed_data(
 
     """
     # Use eth_account's internal utilities to correctly hash EIP-712 data
-    from eth_account._utils.encode_typed_data import hash_domain
     from eth_account._utils.encode_typed_data.encoding_and_hashing import hash_struct
     from eth_utils import keccak
 
     # Hash the EIP-712 data
-    domain_hash = hash_domain(typed_data["domain"])
+    domain_hash = _hash_domain(tuple(sorted(typed_data["domain"].items())))
     message_hash = hash_struct(
         typed_data["primaryType"], typed_data["types"], typed_data["message"]
     )
@@ -59,7 +59,7 @@ async def account_use_spend_permission(
 
     # Create transaction as a DynamicFeeTransaction
     transaction = TransactionRequestEIP1559(
-        to=Web3.to_checksum_address(SPEND_PERMISSION_MANAGER_ADDRESS),
+        to=SPEND_PERMISSION_MANAGER_ADDRESS,
         data=encoded_data,
     )
 
@@ -38,8 +38,9 @@ async def smart_account_use_spend_permission(
 
     # Encode the function call data using web3.py
     w3 = Web3()
+    # SPEND_PERMISSION_MANAGER_ADDRESS is already checksummed, so it is used as-is
     contract = w3.eth.contract(
-        address=w3.to_checksum_address(SPEND_PERMISSION_MANAGER_ADDRESS),
+        address=SPEND_PERMISSION_MANAGER_ADDRESS,
         abi=SPEND_PERMISSION_MANAGER_ABI,
     )
 
@@ -63,9 +64,7 @@ async def smart_account_use_spend_permission(
     encoded_data = contract.encode_abi("spend", args=[permission_tuple, value])
 
     # Create the call
-    call = EncodedCall(
-        to=w3.to_checksum_address(SPEND_PERMISSION_MANAGER_ADDRESS), data=encoded_data, value=0
-    )
+    call = EncodedCall(to=SPEND_PERMISSION_MANAGER_ADDRESS, data=encoded_data, value=0)
 
     # Send the user operation
     return await send_user_operation(
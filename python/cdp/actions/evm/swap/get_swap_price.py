@@ -69,6 +69,8 @@ async def get_swap_price(
     network: str,
     taker: str,
     idempotency_key: str | None = None,
+    slippage_bps: int | None = None,
+    signer_address: str | None = None,
 ) -> SwapPriceResult:
     """Get a price estimate for swapping tokens on EVM networks.
 
@@ -83,6 +85,8 @@ async def get_swap_price(
         network: The network to get the price on ("base" or "ethereum")
         taker: The address that will execute the swap
         idempotency_key: Optional idempotency key for safe retryable requests
+        slippage_bps: Maximum slippage in basis points used for min_to_amount (100 = 1%)
+        signer_address: The address that will sign the transaction (for smart accounts)
 
     Returns:
         SwapPriceResult: The swap price with estimated output amount
@@ -121,6 +125,8 @@ async def get_swap_price(
         from_token=from_token,
         from_amount=amount_str,
         taker=taker,
+        signer_address=signer_address,
+        slippage_bps=slippage_bps,
         _headers=headers,
     )
 
@@ -159,4 +165,7 @@ async def get_swap_price(
         to_amount=to_amount,
         price_ratio=price_ratio,
         expires_at=expires_at.isoformat() + "Z",
+        min_to_amount=response_json.get("minToAmount"),
+        gas_limit=int(response_json["gas"]) if response_json.get("gas") else None,
+        gas_price=response_json.get("gasPrice"),
     )
@@ -26,6 +26,7 @@ class SendSwapOperationOptions:
         network: str,
         paymaster_url: str | None = None,
         idempotency_key: str | None = None,
+        pre_swap_calls: list[EncodedCall] | None = None,
         **swap_params,
     ):
         """Initialize the options.
@@ -35,6 +36,7 @@ class SendSwapOperationOptions:
             network: The network to execute on
             paymaster_url: Optional paymaster URL for gas sponsorship
             idempotency_key: Optional idempotency key for safe retryable requests
+            pre_swap_calls: Optional calls to execute before the swap in the same user operation
             **swap_params: Either swap_quote OR inline parameters (from_token, to_token, etc.)
 
         """
@@ -42,6 +44,7 @@ class SendSwapOperationOptions:
         self.network = network
         self.paymaster_url = paymaster_url
         self.idempotency_key = idempotency_key
+        self.pre_swap_calls = pre_swap_calls or []
 
         # Handle discriminated union: either swap_quote OR inline parameters
         if "swap_quote" in swap_params:
@@ -186,12 +189,12 @@ async def send_swap_operation(
         value=int(swap_data.value) if swap_data.value else 0,
     )
 
-    # Send the swap as a user operation
+    # Send the swap as a user operation, after any calls that must run first (e.g. approvals)
     user_operation = await send_user_operation(
         api_clients=api_clients,
         address=options.smart_account.address,
         owner=options.smart_account.owners[0],
-        calls=[contract_call],
+        calls=[*options.pre_swap_calls, contract_call],
         network=options.network,
         paymaster_url=options.paymaster_url,
     )
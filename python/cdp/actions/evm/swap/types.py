@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from web3 import Web3
 
 from cdp.errors import UserInputValidationError
+from cdp.evm_call_types import EncodedCall
 
 # Supported networks for swap
 SUPPORTED_SWAP_NETWORKS = ["base", "ethereum"]
@@ -314,6 +315,11 @@ class SmartAccountSwapOptions(BaseModel):
         None, description="Optional paymaster URL for gas sponsorship"
     )
     idempotency_key: str | None = Field(None, description="Optional idempotency key")
+    pre_swap_calls: list[EncodedCall] | None = Field(
+        None,
+        description="Calls to execute before the swap in the same user operation, "
+        "e.g. a Permit2 token approval",
+    )
 
     @field_validator("from_token", "to_token")
     @classmethod
@@ -340,6 +346,11 @@ class SwapPriceResult(BaseModel):
     to_token: str = Field(description="The token being swapped to")
     from_amount: str = Field(description="The amount being swapped")
     to_amount: str = Field(description="The expected amount to receive")
+    min_to_amount: str | None = Field(
+        default=None, description="The minimum amount to receive after slippage"
+    )
+    gas_limit: int | None = Field(default=None, description="Estimated gas limit")
+    gas_price: str | None = Field(default=None, description="Estimated gas price")
     price_ratio: str = Field(description="The price ratio between tokens")
     expires_at: str = Field(description="When the price estimate expires")
 
@@ -2,14 +2,12 @@ from typing import cast
 
 from eth_account.typed_transactions import DynamicFeeTransaction
 from eth_typing import HexStr
-from web3 import Web3
 
-from cdp.actions.evm.transfer.constants import ERC20_ABI
 from cdp.actions.evm.transfer.types import (
     TokenType,
     TransferExecutionStrategy,
 )
-from cdp.actions.evm.transfer.utils import get_erc20_address
+from cdp.actions.evm.transfer.utils import get_erc20_address, get_erc20_contract
 from cdp.api_clients import ApiClients
 from cdp.evm_server_account import EvmServerAccount
 from cdp.evm_transaction_types import TransactionRequestEIP1559
@@ -97,10 +95,7 @@ def _encode_erc20_function_call(address: str, function_name: str, args: list) ->
         The encoded function call
 
     """
-    w3 = Web3()
-    contract = w3.eth.contract(address=address, abi=ERC20_ABI)
-
-    return contract.encode_abi(function_name, args=args)
+    return get_erc20_contract(address).encode_abi(function_name, args=args)
 
 
 # Create the instance for use by the transfer function
@@ -1,12 +1,9 @@
-from web3 import Web3
-
 from cdp.actions.evm.send_user_operation import send_user_operation
-from cdp.actions.evm.transfer.constants import ERC20_ABI
 from cdp.actions.evm.transfer.types import (
     TokenType,
     TransferExecutionStrategy,
 )
-from cdp.actions.evm.transfer.utils import get_erc20_address
+from cdp.actions.evm.transfer.utils import get_erc20_address, get_erc20_contract
 from cdp.api_clients import ApiClients
 from cdp.evm_call_types import EncodedCall
 from cdp.evm_smart_account import EvmSmartAccount
@@ -55,12 +52,8 @@ class SmartAccountTransferStrategy(TransferExecutionStrategy):
             # For token transfers, we need to interact with the ERC20 contract
             erc20_address = get_erc20_address(token, network)
 
-            # Encode function calls using Web3
-            w3 = Web3()
-            contract = w3.eth.contract(abi=ERC20_ABI)
-
             # Create transfer call
-            transfer_data = contract.encode_abi("transfer", args=[to, value])
+            transfer_data = get_erc20_contract().encode_abi("transfer", args=[to, value])
 
             # Send user operation with both calls
             return await send_user_operation(
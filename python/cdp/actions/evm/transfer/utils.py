@@ -1,6 +1,11 @@
+import functools
 from typing import cast
 
 from eth_typing import HexStr
+from web3 import Web3
+from web3.contract import Contract
+
+from cdp.actions.evm.transfer.constants import ERC20_ABI
 
 # The address of an ERC20 token for a given network
 ADDRESS_MAP = {
@@ -29,3 +34,20 @@ def get_erc20_address(token: str, network: str) -> HexStr:
     network_addresses = ADDRESS_MAP.get(network, {})
     address = network_addresses.get(token, token)
     return cast(HexStr, address)
+
+
+@functools.lru_cache(maxsize=256)
+def get_erc20_contract(address: str | None = None) -> type[Contract]:
+    """Get an ERC20 contract object for encoding calls, built once per address.
+
+    Building a contract parses the ABI and creates its function descriptors, which is the
+    same work for every transfer of a token.
+
+    Args:
+        address: The contract address, or None for a contract used only to encode calls
+
+    Returns:
+        The ERC20 contract object
+
+    """
+    return Web3().eth.contract(address=address, abi=ERC20_ABI)
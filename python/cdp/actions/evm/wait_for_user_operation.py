@@ -1,3 +1,4 @@
+import asyncio
 import time
 
 from cdp.api_clients import ApiClients
@@ -9,6 +10,8 @@ async def wait_for_user_operation(
     user_op_hash: str,
     timeout_seconds: float = 20,
     interval_seconds: float = 0.2,
+    max_interval_seconds: float | None = None,
+    backoff_factor: float = 1.0,
 ):
     """Wait for a user operation to be processed.
 
@@ -18,6 +21,10 @@ async def wait_for_user_operation(
         user_op_hash (str): The hash of the user operation to wait for.
         timeout_seconds (float, optional): Maximum time to wait in seconds. Defaults to 20.
         interval_seconds (float, optional): Time between checks in seconds. Defaults to 0.2.
+        max_interval_seconds (float, optional): Upper bound for the time between checks when
+            backing off. Defaults to None (no upper bound).
+        backoff_factor (float, optional): Factor the time between checks is multiplied by after
+            each check. Defaults to 1.0 (fixed interval).
 
     Returns:
         EvmUserOperation: The final user operation object.
@@ -34,14 +41,16 @@ async def wait_for_user_operation(
         user_op_hash,
     )
 
+    delay_seconds = interval_seconds
+
     # Use a regular while loop that explicitly checks the status
     while user_operation.status not in ["complete", "failed"]:
         # Check timeout before making next API call
         if time.time() - start_time > timeout_seconds:
             raise TimeoutError("User Operation timed out")
 
-        # Wait before checking again
-        time.sleep(interval_seconds)
+        # Wait before checking again without blocking the event loop
+        await asyncio.sleep(delay_seconds)
 
         # Make API call to check status
         user_operation = await api_clients.evm_smart_accounts.get_user_operation(
@@ -49,4 +58,9 @@ async def wait_for_user_operation(
             user_op_hash,
         )
 
+        # Back off before the next check, capped at max_interval_seconds
+        delay_seconds *= backoff_factor
+        if max_interval_seconds is not None:
+            delay_seconds = min(delay_seconds, max_interval_seconds)
+
     return user_operation
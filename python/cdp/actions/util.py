@@ -1,9 +1,12 @@
-from decimal import Decimal
+# Powers of ten for the decimals used by tokens, computed once
+_POW10 = [10**i for i in range(37)]
 
 
 def format_units(amount, decimals):
     """Convert an amount from atomic units to decimal units.
 
+    Uses integer arithmetic only, so the result is exact for amounts of any size.
+
     Args:
         amount: The amount in atomic units, e.g. wei.
         decimals: The number of decimal places to convert to (e.g. 18 for ETH, 6 for USDC).
@@ -11,5 +14,19 @@ def format_units(amount, decimals):
     Returns:
         str: The amount formatted as a decimal string (e.g. "1.23" for 1.23 ETH).
 
+    Raises:
+        ValueError: If decimals is negative.
+
     """
-    return str(Decimal(amount) / (Decimal(10) ** decimals))
+    if decimals < 0:
+        raise ValueError(f"decimals must be non-negative, got {decimals}")
+
+    amount = int(amount)
+    sign = "-" if amount < 0 else ""
+    if decimals == 0:
+        return str(amount)
+
+    scale = _POW10[decimals] if decimals < len(_POW10) else 10**decimals
+    whole, fraction = divmod(abs(amount), scale)
+    fraction_str = f"{fraction:0{decimals}d}".rstrip("0")
+    return f"{sign}{whole}.{fraction_str}" if fraction_str else f"{sign}{whole}"
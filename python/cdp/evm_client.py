@@ -1132,6 +1132,8 @@ class EvmClient:
         user_op_hash: str,
         timeout_seconds: float = 20,
         interval_seconds: float = 0.2,
+        max_interval_seconds: float | None = None,
+        backoff_factor: float = 1.0,
     ) -> EvmUserOperationModel:
         """Wait for a user operation to be processed.
 
@@ -1140,6 +1142,10 @@ class EvmClient:
             user_op_hash (str): The hash of the user operation to wait for.
             timeout_seconds (float, optional): Maximum time to wait in seconds. Defaults to 20.
             interval_seconds (float, optional): Time between checks in seconds. Defaults to 0.2.
+            max_interval_seconds (float, optional): Upper bound for the time between checks when
+                backing off. Defaults to None (no upper bound).
+            backoff_factor (float, optional): Factor the time between checks is multiplied by
+                after each check. Defaults to 1.0 (fixed interval).
 
         Returns:
             EvmUserOperationModel: The user operation model.
@@ -1153,6 +1159,8 @@ class EvmClient:
                 user_op_hash,
                 timeout_seconds,
                 interval_seconds,
+                max_interval_seconds,
+                backoff_factor,
             )
         except Exception as error:
             track_error(error, "wait_for_user_operation")
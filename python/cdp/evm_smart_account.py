@@ -1,10 +1,14 @@
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
 
 from eth_account.signers.base import BaseAccount
 from pydantic import BaseModel, ConfigDict, Field
 from web3 import Web3
 
-from cdp.actions.evm.list_token_balances import list_token_balances
+from cdp.actions.evm.list_token_balances import (
+    list_token_balances,
+    list_token_balances_stream,
+)
 from cdp.actions.evm.request_faucet import request_faucet
 from cdp.actions.evm.send_user_operation import send_user_operation
 from cdp.actions.evm.sign_and_wrap_typed_data_for_smart_account import (
@@ -14,13 +18,14 @@ from cdp.actions.evm.swap.types import (
     QuoteSwapResult,
     SmartAccountSwapOptions,
     SmartAccountSwapResult,
+    SwapPriceResult,
 )
 from cdp.actions.evm.wait_for_user_operation import wait_for_user_operation
 from cdp.analytics import track_action, track_error
 from cdp.api_clients import ApiClients
 from cdp.evm_call_types import ContractCall
 from cdp.evm_message_types import EIP712Domain
-from cdp.evm_token_balances import ListTokenBalancesResult
+from cdp.evm_token_balances import EvmTokenBalance, ListTokenBalancesResult
 from cdp.openapi_client.models.evm_smart_account import EvmSmartAccount as EvmSmartAccountModel
 from cdp.openapi_client.models.evm_user_operation import EvmUserOperation as EvmUserOperationModel
 
@@ -226,6 +231,44 @@ class EvmSmartAccount(BaseModel):
             track_error(error, "list_token_balances")
             raise
 
+    async def list_token_balances_stream(
+        self,
+        network: str,
+        page_size: int | None = None,
+    ) -> AsyncIterator[EvmTokenBalance]:
+        """Stream the token balances for the smart account on the given network.
+
+        Unlike list_token_balances, this follows the pagination itself and yields each
+        balance as soon as its page arrives.
+
+        Args:
+            network (str): The network to list the token balances for.
+            page_size (int, optional): The number of token balances to request per page. Defaults to None.
+
+        Yields:
+            EvmTokenBalance: The token balances for the smart account on the network.
+
+        """
+        track_action(
+            action="list_token_balances_stream",
+            account_type="evm_smart",
+            properties={
+                "network": network,
+            },
+        )
+
+        try:
+            async for balance in list_token_balances_stream(
+                self.__api_clients.onchain_data,
+                self.address,
+                network,
+                page_size,
+            ):
+                yield balance
+        except Exception as error:
+            track_error(error, "list_token_balances_stream")
+            raise
+
     async def request_faucet(
         self,
         network: str,
@@ -309,6 +352,8 @@ class EvmSmartAccount(BaseModel):
         user_op_hash: str,
         timeout_seconds: float = 20,
         interval_seconds: float = 0.2,
+        max_interval_seconds: float | None = None,
+        backoff_factor: float = 1.0,
     ) -> EvmUserOperationModel:
         """Wait for a user operation to be processed.
 
@@ -316,6 +361,10 @@ class EvmSmartAccount(BaseModel):
             user_op_hash (str): The hash of the user operation to wait for.
             timeout_seconds (float, optional): Maximum time to wait in seconds. Defaults to 20.
             interval_seconds (float, optional): Time between checks in seconds. Defaults to 0.2.
+            max_interval_seconds (float, optional): Upper bound for the time between checks when
+                backing off. Defaults to None (no upper bound).
+            backoff_factor (float, optional): Factor the time between checks is multiplied by
+                after each check. Defaults to 1.0 (fixed interval).
 
         Returns:
             EvmUserOperationModel: The user operation model.
@@ -333,6 +382,8 @@ class EvmSmartAccount(BaseModel):
                 user_op_hash,
                 timeout_seconds,
                 interval_seconds,
+                max_interval_seconds,
+                backoff_factor,
             )
         except Exception as error:
             track_error(error, "wait_for_user_operation")
@@ -447,6 +498,7 @@ class EvmSmartAccount(BaseModel):
                     network=options.swap_quote.network,  # Get network from quote
                     paymaster_url=paymaster_url,
                     idempotency_key=options.idempotency_key,
+                    pre_swap_calls=options.pre_swap_calls,
                     swap_quote=options.swap_quote,
                 )
             else:
@@ -456,6 +508,7 @@ class EvmSmartAccount(BaseModel):
                     network=options.network,
                     paymaster_url=options.paymaster_url,
                     idempotency_key=options.idempotency_key,
+                    pre_swap_calls=options.pre_swap_calls,
                     from_token=options.from_token,
                     to_token=options.to_token,
                     from_amount=options.from_amount,
@@ -546,6 +599,56 @@ class EvmSmartAccount(BaseModel):
             track_error(error, "quote_swap")
             raise
 
+    async def get_swap_price(
+        self,
+        from_token: str,
+        to_token: str,
+        from_amount: str | int,
+        network: str,
+        slippage_bps: int | None = None,
+        idempotency_key: str | None = None,
+    ) -> SwapPriceResult:
+        """Get a swap price for swapping tokens with a smart account.
+
+        Unlike quote_swap, the price carries no transaction data or Permit2 payload, so it
+        cannot be executed. Use it when the amounts are only displayed.
+
+        Args:
+            from_token: The contract address of the token to swap from
+            to_token: The contract address of the token to swap to
+            from_amount: The amount to swap from (in smallest unit)
+            network: The network to get the price on
+            slippage_bps: Maximum slippage in basis points used for min_to_amount (100 = 1%)
+            idempotency_key: Optional idempotency key for safe retryable requests.
+
+        Returns:
+            SwapPriceResult: The swap price with estimated output amount
+
+        Raises:
+            ValueError: If parameters are invalid or liquidity is unavailable
+            Exception: If the API request fails
+
+        """
+        track_action(action="get_swap_price", properties={"network": network})
+
+        try:
+            from cdp.actions.evm.swap.get_swap_price import get_swap_price
+
+            return await get_swap_price(
+                api_clients=self.__api_clients,
+                from_token=from_token,
+                to_token=to_token,
+                from_amount=from_amount,
+                network=network,
+                taker=self.address,  # Smart account is the taker (owns the tokens)
+                idempotency_key=idempotency_key,
+                slippage_bps=slippage_bps,
+                signer_address=self.owners[0].address,  # Owner signs for the smart account
+            )
+        except Exception as error:
+            track_error(error, "get_swap_price")
+            raise
+
     async def sign_typed_data(
         self,
         domain: EIP712Domain,
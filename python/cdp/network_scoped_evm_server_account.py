@@ -3,13 +3,13 @@
 from collections.abc import Callable
 from typing import Any, Literal
 
-from web3 import Web3
-
 from cdp.actions.evm.swap import AccountSwapOptions
+from cdp.actions.evm.transfer.utils import get_erc20_contract
 from cdp.base_node_rpc_url import get_base_node_rpc_url
 from cdp.evm_server_account import EvmServerAccount
 from cdp.network_capabilities import is_method_supported_on_network
 from cdp.network_config import NETWORK_TO_RPC_URL
+from cdp.utils import get_web3
 
 
 class NetworkScopedEvmServerAccount:
@@ -41,7 +41,7 @@ class NetworkScopedEvmServerAccount:
         ]
         self._web3 = None
         if self._rpc_url and not self._should_use_api_for_sends:
-            self._web3 = Web3(Web3.HTTPProvider(self._rpc_url))
+            self._web3 = get_web3(self._rpc_url)
         self._supported_methods: dict[str, Callable] = {}
         self._init_supported_methods()
 
@@ -151,30 +151,31 @@ class NetworkScopedEvmServerAccount:
             else:
                 # ERC20 transfer: approve and transfer
                 erc20_address = _get_erc20_address(token, self._network)
-                contract = w3.eth.contract(address=erc20_address, abi=_ERC20_ABI)
+                contract = get_erc20_contract(erc20_address)
                 nonce = w3.eth.get_transaction_count(from_address)
-                # Approve
+                # Approve. The calldata is encoded directly; send_transaction fills in
+                # the chain id and fees, so build_transaction is not needed.
                 try:
-                    approve_tx = contract.functions.approve(to, amount).build_transaction(
-                        {
-                            "from": from_address,
-                            "nonce": nonce,
-                            "gas": 100000,
-                        }
-                    )
+                    approve_tx = {
+                        "from": from_address,
+                        "to": erc20_address,
+                        "data": contract.encode_abi("approve", args=[to, amount]),
+                        "nonce": nonce,
+                        "gas": 100000,
+                    }
                     approve_hash = w3.eth.send_transaction(approve_tx)
                     w3.eth.wait_for_transaction_receipt(approve_hash)
                 except Exception as e:
                     raise Exception(f"Failed to approve ERC20 transfer: {e}") from e
                 # Transfer
                 try:
-                    transfer_tx = contract.functions.transfer(to, amount).build_transaction(
-                        {
-                            "from": from_address,
-                            "nonce": nonce + 1,
-                            "gas": 100000,
-                        }
-                    )
+                    transfer_tx = {
+                        "from": from_address,
+                        "to": erc20_address,
+                        "data": contract.encode_abi("transfer", args=[to, amount]),
+                        "nonce": nonce + 1,
+                        "gas": 100000,
+                    }
                     transfer_hash = w3.eth.send_transaction(transfer_tx)
                 except Exception as e:
                     raise Exception(f"Failed to send ERC20 transfer: {e}") from e
@@ -199,7 +200,7 @@ class NetworkScopedEvmServerAccount:
         if self._rpc_url:
             if not self._web3:
                 # Initialize web3 if not already done
-                self._web3 = Web3(Web3.HTTPProvider(self._rpc_url))
+                self._web3 = get_web3(self._rpc_url)
 
             receipt = self._web3.eth.wait_for_transaction_receipt(
                 transaction_hash, timeout=timeout_seconds, poll_latency=interval_seconds
@@ -229,7 +230,7 @@ class NetworkScopedEvmServerAccount:
                     "Please use web3.py directly or provide a custom RPC URL."
                 )
 
-            web3 = Web3(Web3.HTTPProvider(network_rpc_url))
+            web3 = get_web3(network_rpc_url)
             receipt = web3.eth.wait_for_transaction_receipt(
                 transaction_hash, timeout=timeout_seconds, poll_latency=interval_seconds
             )
@@ -324,30 +325,6 @@ _ERC20_ADDRESS_MAP = {
     # Add more networks/tokens as needed
 }
 
-# Minimal ERC20 ABI for approve/transfer
-_ERC20_ABI = [
-    {
-        "constant": False,
-        "inputs": [
-            {"name": "_spender", "type": "address"},
-            {"name": "_value", "type": "uint256"},
-        ],
-        "name": "approve",
-        "outputs": [{"name": "", "type": "bool"}],
-        "type": "function",
-    },
-    {
-        "constant": False,
-        "inputs": [
-            {"name": "_to", "type": "address"},
-            {"name": "_value", "type": "uint256"},
-        ],
-        "name": "transfer",
-        "outputs": [{"name": "", "type": "bool"}],
-        "type": "function",
-    },
-]
-
 
 def _get_erc20_address(token: str, network: str) -> str:
     # If token is a contract address, return as is
@@ -3,14 +3,13 @@
 from collections.abc import Callable
 from typing import Any, Literal
 
-from web3 import Web3
-
 from cdp.actions.evm.swap.types import SmartAccountSwapOptions
 from cdp.base_node_rpc_url import get_base_node_rpc_url
 from cdp.evm_call_types import ContractCall
 from cdp.evm_smart_account import EvmSmartAccount
 from cdp.network_capabilities import is_method_supported_on_network
 from cdp.network_config import NETWORK_TO_RPC_URL
+from cdp.utils import get_web3
 
 
 class NetworkScopedEvmSmartAccount:
@@ -38,7 +37,7 @@ class NetworkScopedEvmSmartAccount:
             "ethereum-sepolia",
         ]
         if rpc_url and not self._should_use_api:
-            self._web3 = Web3(Web3.HTTPProvider(rpc_url))
+            self._web3 = get_web3(rpc_url)
         self._supported_methods: dict[str, Callable] = {}
         self._init_supported_methods()
 
@@ -57,6 +56,9 @@ class NetworkScopedEvmSmartAccount:
             self._supported_methods["list_token_balances"] = (
                 self._network_scoped_list_token_balances
             )
+            self._supported_methods["list_token_balances_stream"] = (
+                self._network_scoped_list_token_balances_stream
+            )
         if is_method_supported_on_network("request_faucet", self._network):
             self._supported_methods["request_faucet"] = self._network_scoped_request_faucet
         if is_method_supported_on_network("quote_fund", self._network):
@@ -164,11 +166,15 @@ class NetworkScopedEvmSmartAccount:
         user_op_hash: str,
         timeout_seconds: float = 20,
         interval_seconds: float = 0.2,
+        max_interval_seconds: float | None = None,
+        backoff_factor: float = 1.0,
     ):
         return await self._evm_smart_account.wait_for_user_operation(
             user_op_hash=user_op_hash,
             timeout_seconds=timeout_seconds,
             interval_seconds=interval_seconds,
+            max_interval_seconds=max_interval_seconds,
+            backoff_factor=backoff_factor,
         )
 
     async def _network_scoped_get_user_operation(
@@ -201,13 +207,11 @@ class NetworkScopedEvmSmartAccount:
             import asyncio
             from time import time
 
-            from web3 import Web3
-
             rpc_url = rpc_url or NETWORK_TO_RPC_URL.get(self._network)
             if not rpc_url:
                 raise ValueError(f"No RPC URL available for network: {self._network}")
 
-            w3 = Web3(Web3.HTTPProvider(rpc_url))
+            w3 = get_web3(rpc_url)
             start = time()
             while True:
                 receipt = w3.eth.get_transaction_receipt(transaction_hash)
@@ -230,6 +234,15 @@ class NetworkScopedEvmSmartAccount:
             page_token=page_token,
         )
 
+    def _network_scoped_list_token_balances_stream(
+        self,
+        page_size: int | None = None,
+    ):
+        return self._evm_smart_account.list_token_balances_stream(
+            network=self._network,
+            page_size=page_size,
+        )
+
     async def _network_scoped_request_faucet(
         self,
         token: str,
@@ -3,9 +3,10 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from web3 import Web3
 
 from cdp.actions.evm.spend_permissions.account_use import account_use_spend_permission
-from cdp.spend_permissions import SpendPermission
+from cdp.spend_permissions import SPEND_PERMISSION_MANAGER_ADDRESS, SpendPermission
 
 
 @pytest.mark.asyncio
@@ -91,3 +92,9 @@ async def test_account_use_spend_permission(mock_web3):
             500000000000000000,
         ],
     )
+
+
+def test_spend_permission_manager_address_is_checksummed():
+    """Test the manager address constant is checksummed, since it is used without conversion."""
+    address = SPEND_PERMISSION_MANAGER_ADDRESS
+    assert Web3.to_checksum_address(address) == address
@@ -76,7 +76,7 @@ async def test_smart_account_use_spend_permission(mock_web3, mock_send_user_oper
     assert call_args.kwargs["address"] == "0x3333333333333333333333333333333333333333"
     assert call_args.kwargs["owner"] == smart_account.owners[0]
     assert len(call_args.kwargs["calls"]) == 1
-    assert call_args.kwargs["calls"][0].to == "0XF85210B21CC50302F477BA56686D2019DC9B67AD"
+    assert call_args.kwargs["calls"][0].to == "0xf85210B21cC50302F477BA56686d2019dC9b67Ad"
     assert call_args.kwargs["calls"][0].data == "0xabcdef123456"
     assert call_args.kwargs["calls"][0].value == 0
     assert call_args.kwargs["network"] == "base-sepolia"
@@ -7,6 +7,7 @@ import pytest
 from cdp.actions.evm.sign_and_wrap_typed_data_for_smart_account import (
     SignAndWrapTypedDataForSmartAccountOptions,
     SignAndWrapTypedDataForSmartAccountResult,
+    _hash_domain,
     create_replay_safe_typed_data,
     create_smart_account_signature_wrapper,
     sign_and_wrap_typed_data_for_smart_account,
@@ -279,6 +280,33 @@ class TestCreateReplaySafeTypedData:
 
         assert result["domain"]["chainId"] == 137
 
+    def test_create_replay_safe_typed_data_caches_domain_separator(self):
+        """Test the domain separator is computed once per domain."""
+        from eth_account._utils.encode_typed_data import hash_domain
+
+        domain = {
+            "name": "Permit2",
+            "chainId": 8453,
+            "verifyingContract": "0x000000000022D473030F116dDEE9F6B43aC78BA3",
+        }
+        typed_data = {
+            "domain": domain,
+            "types": {"Message": [{"name": "data", "type": "string"}]},
+            "primaryType": "Message",
+            "message": {"data": "Hello"},
+        }
+        _hash_domain.cache_clear()
+
+        first = create_replay_safe_typed_data(typed_data, 8453, "0x" + "12" * 20)
+        second = create_replay_safe_typed_data(
+            {**typed_data, "domain": dict(reversed(list(domain.items())))}, 8453, "0x" + "12" * 20
+        )
+
+        assert first == second
+        assert _hash_domain.cache_info().misses == 1
+        assert _hash_domain.cache_info().hits == 1
+        assert _hash_domain(tuple(sorted(domain.items()))) == hash_domain(domain)
+
 
 class TestCreateSmartAccountSignatureWrapper:
     """Test the create_smart_account_signature_wrapper function."""
@@ -9,12 +9,13 @@ from cdp.openapi_client.models.evm_user_operation import EvmUserOperation
 
 
 @pytest.mark.asyncio
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio")
 @patch("cdp.actions.evm.wait_for_user_operation.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_success_immediate(mock_api_clients, mock_time):
+async def test_wait_for_user_operation_success_immediate(mock_api_clients, mock_time, mock_asyncio):
     """Test successful completion of a user operation that is already complete."""
     mock_time.time.return_value = 1000
-    mock_time.sleep = MagicMock()
+    mock_asyncio.sleep = AsyncMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -37,16 +38,19 @@ async def test_wait_for_user_operation_success_immediate(mock_api_clients, mock_
     mock_api_clients.evm_smart_accounts.get_user_operation.assert_called_once_with(
         mock_smart_account.address, mock_user_op.user_op_hash
     )
-    mock_time.sleep.assert_not_called()
+    mock_asyncio.sleep.assert_not_called()
 
 
 @pytest.mark.asyncio
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio")
 @patch("cdp.actions.evm.wait_for_user_operation.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_success_after_poll(mock_api_clients, mock_time):
+async def test_wait_for_user_operation_success_after_poll(
+    mock_api_clients, mock_time, mock_asyncio
+):
     """Test successful completion of a user operation after polling."""
     mock_time.time.side_effect = [1000, 1000.5, 1001]
-    mock_time.sleep = MagicMock()
+    mock_asyncio.sleep = AsyncMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -73,16 +77,57 @@ async def test_wait_for_user_operation_success_after_poll(mock_api_clients, mock
 
     assert result == mock_updated_op
     assert mock_api_clients.evm_smart_accounts.get_user_operation.call_count == 2
-    mock_time.sleep.assert_called_once_with(0.2)
+    mock_asyncio.sleep.assert_awaited_once_with(0.2)
 
 
 @pytest.mark.asyncio
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio")
 @patch("cdp.actions.evm.wait_for_user_operation.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_failed_status(mock_api_clients, mock_time):
+async def test_wait_for_user_operation_backoff(mock_api_clients, mock_time, mock_asyncio):
+    """Test that the interval between checks backs off up to max_interval_seconds."""
+    mock_time.time.side_effect = [1000, 1000.1, 1000.4, 1000.8]
+    mock_asyncio.sleep = AsyncMock()
+
+    mock_smart_account = MagicMock(spec=EvmSmartAccount)
+    mock_smart_account.address = "0x1234567890123456789012345678901234567890"
+
+    mock_pending_op = MagicMock(spec=EvmUserOperation)
+    mock_pending_op.user_op_hash = "0xuserhash123"
+    mock_pending_op.status = "pending"
+
+    mock_complete_op = MagicMock(spec=EvmUserOperation)
+    mock_complete_op.user_op_hash = "0xuserhash123"
+    mock_complete_op.status = "complete"
+
+    mock_api_clients.evm_smart_accounts.get_user_operation = AsyncMock(
+        side_effect=[mock_pending_op, mock_pending_op, mock_pending_op, mock_complete_op]
+    )
+
+    result = await wait_for_user_operation(
+        api_clients=mock_api_clients,
+        smart_account_address=mock_smart_account.address,
+        user_op_hash=mock_pending_op.user_op_hash,
+        timeout_seconds=20,
+        interval_seconds=0.2,
+        max_interval_seconds=0.4,
+        backoff_factor=1.5,
+    )
+
+    assert result == mock_complete_op
+    assert [call.args[0] for call in mock_asyncio.sleep.await_args_list] == pytest.approx(
+        [0.2, 0.3, 0.4]
+    )
+
+
+@pytest.mark.asyncio
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio")
+@patch("cdp.actions.evm.wait_for_user_operation.time")
+@patch("cdp.cdp_client.ApiClients")
+async def test_wait_for_user_operation_failed_status(mock_api_clients, mock_time, mock_asyncio):
     """Test handling of a user operation that completes with 'failed' status."""
     mock_time.time.side_effect = [1000, 1000.5, 1001]
-    mock_time.sleep = MagicMock()
+    mock_asyncio.sleep = AsyncMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -109,13 +154,14 @@ async def test_wait_for_user_operation_failed_status(mock_api_clients, mock_time
 
     assert result == mock_updated_op
     assert mock_api_clients.evm_smart_accounts.get_user_operation.call_count == 2
-    mock_time.sleep.assert_called_once_with(0.2)
+    mock_asyncio.sleep.assert_awaited_once_with(0.2)
 
 
 @pytest.mark.asyncio
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio")
 @patch("cdp.actions.evm.wait_for_user_operation.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_timeout(mock_api_clients, mock_time):
+async def test_wait_for_user_operation_timeout(mock_api_clients, mock_time, mock_asyncio):
     """Test timeout for a user operation that never completes."""
     start_time = 1000
 
@@ -140,7 +186,7 @@ async def test_wait_for_user_operation_timeout(mock_api_clients, mock_time):
     ]
 
     mock_time.time.side_effect = time_values
-    mock_time.sleep = MagicMock()
+    mock_asyncio.sleep = AsyncMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -161,16 +207,17 @@ async def test_wait_for_user_operation_timeout(mock_api_clients, mock_time):
         )
 
     assert mock_api_clients.evm_smart_accounts.get_user_operation.call_count > 1
-    assert mock_time.sleep.call_count > 1
+    assert mock_asyncio.sleep.call_count > 1
 
 
 @pytest.mark.asyncio
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio")
 @patch("cdp.actions.evm.wait_for_user_operation.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_api_error(mock_api_clients, mock_time):
+async def test_wait_for_user_operation_api_error(mock_api_clients, mock_time, mock_asyncio):
     """Test handling of API errors during polling."""
     mock_time.time.side_effect = [1000, 1000.5]
-    mock_time.sleep = MagicMock()
+    mock_asyncio.sleep = AsyncMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -201,9 +248,12 @@ async def test_wait_for_user_operation_api_error(mock_api_clients, mock_time):
 
 
 @pytest.mark.asyncio
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio")
 @patch("cdp.actions.evm.wait_for_user_operation.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_custom_timeout_and_interval(mock_api_clients, mock_time):
+async def test_wait_for_user_operation_custom_timeout_and_interval(
+    mock_api_clients, mock_time, mock_asyncio
+):
     """Test using custom timeout and interval values."""
     start_time = 1000
     mock_time.time.side_effect = [
@@ -213,7 +263,7 @@ async def test_wait_for_user_operation_custom_timeout_and_interval(mock_api_clie
         start_time + 3,
         start_time + 11,
     ]
-    mock_time.sleep = MagicMock()
+    mock_asyncio.sleep = AsyncMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -233,16 +283,19 @@ async def test_wait_for_user_operation_custom_timeout_and_interval(mock_api_clie
             interval_seconds=1.0,
         )
 
-    mock_time.sleep.assert_called_with(1.0)
+    mock_asyncio.sleep.assert_called_with(1.0)
 
 
 @pytest.mark.asyncio
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio")
 @patch("cdp.actions.evm.wait_for_user_operation.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_multiple_status_changes(mock_api_clients, mock_time):
+async def test_wait_for_user_operation_multiple_status_changes(
+    mock_api_clients, mock_time, mock_asyncio
+):
     """Test handling of a user operation that goes through multiple status changes."""
     mock_time.time.side_effect = [1000, 1000.5, 1001, 1001.5]
-    mock_time.sleep = MagicMock()
+    mock_asyncio.sleep = AsyncMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -273,16 +326,19 @@ async def test_wait_for_user_operation_multiple_status_changes(mock_api_clients,
 
     assert result == mock_complete_op
     assert mock_api_clients.evm_smart_accounts.get_user_operation.call_count == 3
-    assert mock_time.sleep.call_count == 2
+    assert mock_asyncio.sleep.call_count == 2
 
 
 @pytest.mark.asyncio
+@patch("cdp.actions.evm.wait_for_user_operation.asyncio")
 @patch("cdp.actions.evm.wait_for_user_operation.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_invalid_user_op_hash(mock_api_clients, mock_time):
+async def test_wait_for_user_operation_invalid_user_op_hash(
+    mock_api_clients, mock_time, mock_asyncio
+):
     """Test handling of an API error when user_op_hash is invalid."""
     mock_time.time.return_value = 1000
-    mock_time.sleep = MagicMock()
+    mock_asyncio.sleep = AsyncMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
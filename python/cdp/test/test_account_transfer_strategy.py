@@ -6,6 +6,7 @@ from cdp.actions.evm.transfer.account_transfer_strategy import (
     AccountTransferStrategy,
     account_transfer_strategy,
 )
+from cdp.actions.evm.transfer.utils import get_erc20_contract
 from cdp.api_clients import ApiClients
 from cdp.evm_server_account import EvmServerAccount
 from cdp.openapi_client.models.send_evm_transaction_request import SendEvmTransactionRequest
@@ -93,6 +94,19 @@ async def test_execute_transfer_erc20():
     assert result == "0xtransfer456"
 
 
+def test_get_erc20_contract_is_cached():
+    """Test that ERC20 contract objects are built once per address."""
+    address = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+
+    assert get_erc20_contract(address) is get_erc20_contract(address)
+    assert get_erc20_contract() is get_erc20_contract()
+    assert get_erc20_contract(address).encode_abi(
+        "transfer", args=["0x2345678901234567890123456789012345678901", 1000000]
+    ) == get_erc20_contract().encode_abi(
+        "transfer", args=["0x2345678901234567890123456789012345678901", 1000000]
+    )
+
+
 def test_singleton_instance():
     """Test that account_transfer_strategy is an instance of AccountTransferStrategy."""
     assert isinstance(account_transfer_strategy, AccountTransferStrategy)
@@ -765,6 +765,8 @@ async def test_wait_for_user_operation(mock_wait_for_user_operation, smart_accou
         user_op_hash=mock_user_operation["hash"],
         timeout_seconds=30,
         interval_seconds=0.5,
+        max_interval_seconds=2,
+        backoff_factor=1.5,
     )
 
     mock_wait_for_user_operation.assert_called_once_with(
@@ -773,6 +775,8 @@ async def test_wait_for_user_operation(mock_wait_for_user_operation, smart_accou
         mock_user_operation["hash"],
         30,
         0.5,
+        2,
+        1.5,
     )
 
     assert result == mock_wait_result
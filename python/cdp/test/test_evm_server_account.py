@@ -480,3 +480,53 @@ async def test_use_network(server_account_model_factory):
     assert network_account.address == address
     assert network_account.network == network
     assert network_account.rpc_url is None
+
+
+@pytest.mark.asyncio
+async def test_network_scoped_erc20_transfer_with_custom_rpc(server_account_model_factory):
+    """Test that an ERC20 transfer over a custom RPC encodes approve and transfer calldata directly."""
+    address = "0x1234567890123456789012345678901234567890"
+    token_address = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+    to_address = "0x2345678901234567890123456789012345678901"
+
+    server_account_model = server_account_model_factory(address, "test-account")
+    dummy_api = object()
+    account = EvmServerAccount(server_account_model, dummy_api, dummy_api)
+    network_account = await account.__experimental_use_network__("https://rpc.example.com")
+
+    mock_w3 = MagicMock()
+    mock_w3.eth.get_transaction_count.return_value = 7
+    network_account._web3 = mock_w3
+
+    await network_account.transfer(to=to_address, amount=1000000, token=token_address)
+
+    approve_tx, transfer_tx = (call.args[0] for call in mock_w3.eth.send_transaction.call_args_list)
+    assert approve_tx["to"] == transfer_tx["to"] == token_address
+    assert approve_tx["data"].startswith("0x095ea7b3")
+    assert transfer_tx["data"].startswith("0xa9059cbb")
+    assert approve_tx["data"][10:] == transfer_tx["data"][10:]
+    assert (approve_tx["nonce"], transfer_tx["nonce"]) == (7, 8)
+    mock_w3.eth.wait_for_transaction_receipt.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_network_scoped_accounts_share_web3_per_rpc_url(server_account_model_factory):
+    """Test that network-scoped accounts on the same custom RPC URL reuse one Web3 instance."""
+    dummy_api = object()
+    first = EvmServerAccount(
+        server_account_model_factory("0x1234567890123456789012345678901234567890", "first"),
+        dummy_api,
+        dummy_api,
+    )
+    second = EvmServerAccount(
+        server_account_model_factory("0x2345678901234567890123456789012345678901", "second"),
+        dummy_api,
+        dummy_api,
+    )
+
+    first_scoped = await first.__experimental_use_network__("https://rpc.example.com")
+    second_scoped = await second.__experimental_use_network__("https://rpc.example.com")
+    other_scoped = await first.__experimental_use_network__("https://other-rpc.example.com")
+
+    assert first_scoped._web3 is second_scoped._web3
+    assert first_scoped._web3 is not other_scoped._web3
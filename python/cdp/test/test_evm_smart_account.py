@@ -111,6 +111,48 @@ async def test_list_token_balances(smart_account_factory, evm_token_balances_mod
     assert result == expected_result
 
 
+@pytest.mark.asyncio
+async def test_list_token_balances_stream(smart_account_factory, evm_token_balances_model_factory):
+    """Test list_token_balances_stream follows pagination and yields every balance."""
+    address = "0x1234567890123456789012345678901234567890"
+    name = "test-account"
+    smart_account = smart_account_factory(address, name)
+
+    mock_onchain_data_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.onchain_data = mock_onchain_data_api
+
+    mock_onchain_data_api.list_data_token_balances = AsyncMock(
+        side_effect=[
+            evm_token_balances_model_factory(next_page_token="next-page-token"),
+            evm_token_balances_model_factory(next_page_token=None),
+        ]
+    )
+
+    smart_account = EvmSmartAccount(address, smart_account.owners[0], name, None, mock_api_clients)
+
+    balances = [
+        balance
+        async for balance in smart_account.list_token_balances_stream(
+            network="base-sepolia", page_size=1
+        )
+    ]
+
+    assert len(balances) == 2
+    assert all(isinstance(balance, EvmTokenBalance) for balance in balances)
+    assert balances[0].amount == EvmTokenAmount(amount=1000000000000000000, decimals=18)
+    assert mock_onchain_data_api.list_data_token_balances.call_args_list[0].kwargs == {
+        "address": address,
+        "network": "base-sepolia",
+        "page_size": 1,
+        "page_token": None,
+    }
+    assert (
+        mock_onchain_data_api.list_data_token_balances.call_args_list[1].kwargs["page_token"]
+        == "next-page-token"
+    )
+
+
 @pytest.mark.asyncio
 @patch("cdp.actions.evm.send_user_operation.Web3")
 @patch("cdp.actions.evm.send_user_operation.ensure_awaitable")
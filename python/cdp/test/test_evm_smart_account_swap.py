@@ -9,8 +9,10 @@ from cdp.actions.evm.swap.types import (
     QuoteSwapResult,
     SmartAccountSwapOptions,
     SmartAccountSwapResult,
+    SwapPriceResult,
     SwapUnavailableResult,
 )
+from cdp.evm_call_types import EncodedCall
 from cdp.evm_smart_account import EvmSmartAccount
 
 
@@ -263,6 +265,32 @@ class TestEvmSmartAccountSwap:
         assert result.user_op_hash == "0xmocked_user_op_hash"
         assert result.status == "pending"
 
+    @pytest.mark.asyncio
+    async def test_swap_with_pre_swap_calls(self, smart_account, mock_api_clients):
+        """Test that pre-swap calls are sent before the swap in the same user operation."""
+        approve_call = EncodedCall(
+            to="0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+            data="0x095ea7b3",
+            value=0,
+        )
+        swap_options = SmartAccountSwapOptions(
+            network="base",
+            from_token="0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+            to_token="0x4200000000000000000000000000000000000006",
+            from_amount="1000000",
+            pre_swap_calls=[approve_call],
+        )
+
+        result = await smart_account.swap(swap_options)
+
+        assert result.user_op_hash == "0xmocked_user_op_hash"
+        _, prepare_request = mock_api_clients.evm_smart_accounts.prepare_user_operation.call_args[0]
+        assert len(prepare_request.calls) == 2
+        assert prepare_request.calls[0].to == approve_call.to
+        assert prepare_request.calls[0].data == approve_call.data
+        assert prepare_request.calls[1].to == "0xdef1c0ded9bec7f1a1670819833240f027b25eff"
+        assert prepare_request.calls[1].data == "0xabc123def456"
+
     @pytest.mark.asyncio
     @patch("cdp.actions.evm.swap.create_swap_quote")
     async def test_quote_swap(self, mock_create_quote, smart_account, mock_api_clients):
@@ -325,6 +353,63 @@ class TestEvmSmartAccountSwap:
         assert isinstance(result, SwapUnavailableResult)
         assert result.liquidity_available is False
 
+    @pytest.mark.asyncio
+    async def test_get_swap_price(self, smart_account, mock_api_clients):
+        """Test get_swap_price fetches a price with the smart account as taker."""
+        mock_price_response = MagicMock()
+        mock_price_response.read = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "liquidityAvailable": True,
+                    "toAmount": "500000000000000",
+                    "minToAmount": "495000000000000",
+                    "gas": "200000",
+                    "gasPrice": "1000000000",
+                }
+            ).encode("utf-8")
+        )
+        mock_api_clients.evm_swaps.get_evm_swap_price_without_preload_content = AsyncMock(
+            return_value=mock_price_response
+        )
+        mock_api_clients.evm_swaps.create_evm_swap_quote_without_preload_content = AsyncMock()
+
+        result = await smart_account.get_swap_price(
+            from_token="0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+            to_token="0x4200000000000000000000000000000000000006",
+            from_amount="1000000",
+            network="base",
+            slippage_bps=200,
+        )
+
+        assert isinstance(result, SwapPriceResult)
+        assert result.to_amount == "500000000000000"
+        assert result.min_to_amount == "495000000000000"
+        assert result.gas_limit == 200000
+        mock_api_clients.evm_swaps.create_evm_swap_quote_without_preload_content.assert_not_called()
+        call_args = mock_api_clients.evm_swaps.get_evm_swap_price_without_preload_content.call_args
+        assert call_args.kwargs["taker"] == smart_account.address
+        assert call_args.kwargs["signer_address"] == smart_account.owners[0].address
+        assert call_args.kwargs["slippage_bps"] == 200
+
+    @pytest.mark.asyncio
+    async def test_get_swap_price_no_liquidity(self, smart_account, mock_api_clients):
+        """Test get_swap_price raises when no liquidity is available."""
+        mock_price_response = MagicMock()
+        mock_price_response.read = AsyncMock(
+            return_value=json.dumps({"liquidityAvailable": False}).encode("utf-8")
+        )
+        mock_api_clients.evm_swaps.get_evm_swap_price_without_preload_content = AsyncMock(
+            return_value=mock_price_response
+        )
+
+        with pytest.raises(ValueError, match="Insufficient liquidity"):
+            await smart_account.get_swap_price(
+                from_token="0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+                to_token="0x4200000000000000000000000000000000000006",
+                from_amount="1000000000000",  # Large amount
+                network="base",
+            )
+
     @pytest.mark.asyncio
     async def test_quote_swap_default_slippage(self, smart_account, mock_api_clients):
         """Test quote_swap with default slippage."""
@@ -0,0 +1,46 @@
+import pytest
+
+from cdp.actions.util import format_units
+
+
+def test_format_units_basic():
+    """Test basic formatting of atomic amounts."""
+    assert format_units(10**18, 18) == "1"
+    assert format_units(123 * 10**16, 18) == "1.23"
+    assert format_units(1, 18) == "0.000000000000000001"
+    assert format_units(1_500_000, 6) == "1.5"
+    assert format_units(0, 18) == "0"
+
+
+def test_format_units_negative():
+    """Test formatting of negative amounts."""
+    assert format_units(-(10**18), 18) == "-1"
+    assert format_units(-1, 6) == "-0.000001"
+
+
+def test_format_units_string_amount():
+    """Test formatting of amounts given as strings."""
+    assert format_units("2500000", 6) == "2.5"
+
+
+def test_format_units_zero_decimals():
+    """Test formatting with no decimal places."""
+    assert format_units(42, 0) == "42"
+
+
+def test_format_units_large_amount():
+    """Test that amounts beyond Decimal's default precision are formatted exactly."""
+    amount = 123456789012345678901234567890123456789
+    assert format_units(amount, 18) == "123456789012345678901.234567890123456789"
+
+
+def test_format_units_decimals_beyond_lookup_table():
+    """Test that decimals past the precomputed powers of ten are still formatted exactly."""
+    assert format_units(10**40, 40) == "1"
+    assert format_units(15, 37) == "0." + "0" * 35 + "15"
+
+
+def test_format_units_negative_decimals():
+    """Test that negative decimals are rejected instead of indexing from the end of the table."""
+    with pytest.raises(ValueError, match="decimals must be non-negative"):
+        format_units(10**18, -1)
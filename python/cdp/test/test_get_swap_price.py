@@ -171,6 +171,42 @@ class TestGetSwapPrice:
         call_args = mock_api_clients.evm_swaps.get_evm_swap_price_without_preload_content.call_args
         assert call_args.kwargs["_headers"]["X-Idempotency-Key"] == "test-key-123"
 
+    @pytest.mark.asyncio
+    async def test_get_swap_price_with_slippage_and_gas(
+        self, mock_api_clients, valid_response_data
+    ):
+        """Test swap price forwards slippage and signer and returns min amount and gas."""
+        response_data = {
+            **valid_response_data,
+            "minToAmount": "495000000000000",
+            "gas": "200000",
+            "gasPrice": "1000000000",
+        }
+        mock_response = AsyncMock()
+        mock_response.read = AsyncMock(return_value=json.dumps(response_data).encode())
+
+        mock_api_clients.evm_swaps.get_evm_swap_price_without_preload_content = AsyncMock(
+            return_value=mock_response
+        )
+
+        result = await get_swap_price(
+            api_clients=mock_api_clients,
+            from_token="0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+            to_token="0x4200000000000000000000000000000000000006",
+            from_amount="1000000",
+            network="base",
+            taker="0x742d35Cc6634C0532925a3b844Bc9e7595f12345",
+            slippage_bps=200,
+            signer_address="0x9876543210987654321098765432109876543210",
+        )
+
+        assert result.min_to_amount == "495000000000000"
+        assert result.gas_limit == 200000
+        assert result.gas_price == "1000000000"
+        call_args = mock_api_clients.evm_swaps.get_evm_swap_price_without_preload_content.call_args
+        assert call_args.kwargs["slippage_bps"] == 200
+        assert call_args.kwargs["signer_address"] == "0x9876543210987654321098765432109876543210"
+
     @pytest.mark.asyncio
     async def test_get_swap_price_amount_as_int(self, mock_api_clients, valid_response_data):
         """Test swap price with amount as integer."""
@@ -1,9 +1,11 @@
+import functools
 import hashlib
 import inspect
 import re
 import uuid
 
 from eth_account.typed_transactions import DynamicFeeTransaction
+from web3 import Web3
 
 
 async def ensure_awaitable(func, *args, **kwargs):
@@ -176,3 +178,20 @@ def sort_keys(obj: dict) -> dict:
         return [sort_keys(item) for item in obj]
 
     return {key: sort_keys(obj[key]) for key in sorted(obj.keys())}
+
+
+@functools.lru_cache(maxsize=16)
+def get_web3(rpc_url: str) -> Web3:
+    """Get a Web3 instance for an RPC URL, created on first use and shared afterwards.
+
+    Reusing one instance per URL keeps its provider's HTTP session, and so its open
+    connections, across calls instead of building a new provider each time.
+
+    Args:
+        rpc_url: The RPC URL to connect to
+
+    Returns:
+        The Web3 instance for the RPC URL
+
+    """
+    return Web3(Web3.HTTPProvider(rpc_url))